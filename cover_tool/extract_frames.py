@@ -4,7 +4,7 @@ import argparse
 import subprocess
 import shutil
 from typing import Optional
-from typing import List, Tuple
+from typing import Iterator, List, Tuple
 from typing import Optional
 import cv2
 import numpy as np
@@ -164,9 +164,203 @@ def probe_video_duration_seconds(video_path: str) -> Optional[float]:
         return None
 
 
+
+def probe_video_meta(video_path: str) -> Tuple[Optional[Tuple[int, int]], Optional[float]]:
+    """Probe resolution and duration of a video in a single open.
+
+    - Opens the container once in-process via OpenCV and reads width/height,
+      fps and frame count, so no ffprobe subprocess is spawned.
+    - Auto-rotation is disabled so the size matches ffprobe's coded
+      ``stream=width,height`` (as reported by `probe_video_resolution`).
+    - Falls back to one ffprobe call querying both fields when OpenCV
+      cannot provide them.
+
+    Returns:
+        ((width, height) or None, duration seconds or None)
+    """
+    resolution: Optional[Tuple[int, int]] = None
+    duration: Optional[float] = None
+    try:
+        cap = cv2.VideoCapture(video_path)
+        if cap.isOpened():
+            try:
+                cap.set(cv2.CAP_PROP_ORIENTATION_AUTO, 0)
+            except Exception:
+                pass
+            width = int(cap.get(cv2.CAP_PROP_FRAME_WIDTH) or 0)
+            height = int(cap.get(cv2.CAP_PROP_FRAME_HEIGHT) or 0)
+            fps = float(cap.get(cv2.CAP_PROP_FPS) or 0.0)
+            frame_count = float(cap.get(cv2.CAP_PROP_FRAME_COUNT) or 0.0)
+            cap.release()
+            if width > 0 and height > 0:
+                resolution = (width, height)
+            if fps > 0 and frame_count > 0:
+                duration = frame_count / fps
+    except Exception:
+        # Ignore and try ffprobe
+        pass
+    if resolution is not None and duration is not None:
+        return resolution, duration
+
+    # Fallback to a single ffprobe query for both fields
+    cmd = [
+        "ffprobe",
+        "-v",
+        "error",
+        "-select_streams",
+        "v:0",
+        "-show_entries",
+        "stream=width,height:format=duration",
+        "-of",
+        "default=noprint_wrappers=1",
+        video_path,
+    ]
+    try:
+        res = subprocess.run(cmd, check=True, capture_output=True, text=True, encoding="utf-8", errors="ignore", **get_subprocess_silent_kwargs())
+        fields = dict(line.split("=", 1) for line in res.stdout.splitlines() if "=" in line)
+        if resolution is None:
+            try:
+                width, height = int(fields["width"]), int(fields["height"])
+                if width > 0 and height > 0:
+                    resolution = (width, height)
+            except (KeyError, ValueError):
+                pass
+        if duration is None:
+            try:
+                duration = float(fields["duration"])
+            except (KeyError, ValueError):
+                pass
+    except Exception:
+        pass
+    return resolution, duration
+
 # 旧的 ffmpeg 抽帧逻辑已移除，模块现仅使用 OpenCV 进行清晰度分析。
 
 
+def _frame_sharpness_cv(frame: np.ndarray) -> float:
+    """Return the Laplacian variance of the frame's center ROI (higher is sharper)."""
+    # 中心裁剪 + 下采样以提升速度，同时保持与清晰度相关的边缘信息
+    h, w = frame.shape[:2]
+    crop_ratio = 0.6
+    cw, ch = int(w * crop_ratio), int(h * crop_ratio)
+    x0 = max(0, (w - cw) // 2)
+    y0 = max(0, (h - ch) // 2)
+    roi = frame[y0:y0 + ch, x0:x0 + cw]
+
+    # 将较大分辨率缩放到最大边 640 像素以内
+    max_side = 640
+    if max(cw, ch) > max_side:
+        scale = max_side / float(max(cw, ch))
+        roi = cv2.resize(roi, (int(cw * scale), int(ch * scale)), interpolation=cv2.INTER_AREA)
+
+    gray = cv2.cvtColor(roi, cv2.COLOR_BGR2GRAY)
+    # 更轻量的拉普拉斯与方差估计
+    lap16 = cv2.Laplacian(gray, cv2.CV_16S, ksize=3)
+    mean, stddev = cv2.meanStdDev(lap16)
+    return float((stddev[0][0]) ** 2)
+
+
+def iter_sharpest_frames_cv(
+    video_path: str,
+    windows: List[Tuple[float, float]],
+) -> Iterator[Tuple[bool, Optional[np.ndarray], str, float, int]]:
+    """Yield the sharpest frame of each time window using one OpenCV decoder.
+
+    The video is opened once and decoded forward through all windows (which
+    should be sorted by start time): it seeks only to the first window's
+    start and then advances with ``grab()``, so consecutive windows do not
+    reopen the file or seek again. Results are yielded as soon as each
+    window has been scanned, letting callers save a frame while the next
+    window is decoded.
+
+    Args:
+        video_path: Path to the input video.
+        windows: List of (start_time_sec, end_time_sec) windows.
+
+    Yields:
+        (ok, best_frame, msg, best_score, best_frame_num) per window, in the
+        same format as `compute_sharpest_frame_cv`.
+    """
+    cap = cv2.VideoCapture(video_path)
+    try:
+        if not cap.isOpened():
+            for _ in windows:
+                yield False, None, f"无法打开视频文件: {video_path}", 0.0, -1
+            return
+
+        fps = cap.get(cv2.CAP_PROP_FPS)
+        if not fps or fps <= 0:
+            fps = 25.0  # Fallback FPS
+        # Clamp to valid range using CAP_PROP_FRAME_COUNT if available
+        total_frames = int(cap.get(cv2.CAP_PROP_FRAME_COUNT) or 0)
+
+        # 采样优化：每秒仅分析 ~2 帧，跳读减少解码和计算负担
+        target_analyze_fps = 2.0
+        sample_every = max(1, int(round(fps / target_analyze_fps)))
+
+        # 下一次 read()/grab() 将得到的帧号；读到结尾或解码失败后不再继续
+        next_pos = 0
+        ended = False
+        for start_time_sec, end_time_sec in windows:
+            if end_time_sec <= start_time_sec:
+                yield False, None, "Invalid time window: end_time_sec must be greater than start_time_sec", 0.0, -1
+                continue
+
+            start_frame = int(max(0, start_time_sec) * fps)
+            end_frame = int(max(start_time_sec, end_time_sec) * fps)
+            if total_frames > 0:
+                end_frame = min(end_frame, total_frames - 1)
+
+            best_frame: Optional[np.ndarray] = None
+            best_frame_score: float = -1.0
+            best_frame_num: int = -1
+
+            # 只在首个窗口起点定位一次；之后用 grab() 顺序跳过未采样帧。
+            # 逐个采样点 CAP_PROP_POS_FRAMES 定位时，每次都要从前一个关键帧重新解码，
+            # 在采样间隔远小于 GOP 时代价远高于顺序 grab（grab 不做像素格式转换）。
+            if not ended and next_pos == 0 and start_frame > 0:
+                try:
+                    if cap.set(cv2.CAP_PROP_POS_FRAMES, start_frame):
+                        next_pos = start_frame
+                except Exception:
+                    # 如果跳读失败，保持连续读取
+                    pass
+            while not ended and next_pos < start_frame:
+                if not cap.grab():
+                    ended = True
+                next_pos += 1
+
+            pos = next_pos
+            while not ended and pos <= end_frame:
+                success, frame = cap.read()
+                next_pos = pos + 1
+                if not success or frame is None:
+                    ended = True
+                    break
+
+                variance = _frame_sharpness_cv(frame)
+                if variance > best_frame_score:
+                    best_frame_score = variance
+                    best_frame = frame
+                    best_frame_num = pos
+
+                pos += sample_every
+                if pos > end_frame:
+                    break
+                for _ in range(sample_every - 1):
+                    if not cap.grab():
+                        ended = True
+                        break
+                    next_pos += 1
+
+            if best_frame is None:
+                yield False, None, "未能分析到任何帧", 0.0, -1
+            else:
+                yield True, best_frame, "Sharpest frame computed", best_frame_score, best_frame_num
+    finally:
+        cap.release()
+
+
 def compute_sharpest_frame_cv(
     video_path: str,
     start_time_sec: float,
@@ -175,6 +369,7 @@ def compute_sharpest_frame_cv(
     """Compute the sharpest frame within [start_time_sec, end_time_sec] using OpenCV.
 
     This uses Laplacian variance on grayscale frames as the sharpness score.
+    Single-window form of `iter_sharpest_frames_cv`.
 
     Args:
         video_path: Path to the input video.
@@ -192,75 +387,17 @@ def compute_sharpest_frame_cv(
     if end_time_sec <= start_time_sec:
         return False, None, "Invalid time window: end_time_sec must be greater than start_time_sec", 0.0, -1
 
-    cap = cv2.VideoCapture(video_path)
-    if not cap.isOpened():
-        return False, None, f"无法打开视频文件: {video_path}", 0.0, -1
-
-    fps = cap.get(cv2.CAP_PROP_FPS)
-    if not fps or fps <= 0:
-        fps = 25.0  # Fallback FPS
-
-    start_frame = int(max(0, start_time_sec) * fps)
-    end_frame = int(max(start_time_sec, end_time_sec) * fps)
-
-    # Clamp to valid range using CAP_PROP_FRAME_COUNT if available
-    total_frames = int(cap.get(cv2.CAP_PROP_FRAME_COUNT) or 0)
-    if total_frames > 0:
-        end_frame = min(end_frame, total_frames - 1)
-
-    # 采样优化：每秒仅分析 ~2 帧，跳读减少解码和计算负担
-    target_analyze_fps = 2.0
-    sample_every = max(1, int(round(fps / target_analyze_fps)))
-
-    best_frame: Optional[np.ndarray] = None
-    best_frame_score: float = -1.0
-    best_frame_num: int = -1
-
-    for pos in range(start_frame, end_frame + 1, sample_every):
-        try:
-            cap.set(cv2.CAP_PROP_POS_FRAMES, pos)
-        except Exception:
-            # 如果跳读失败，保持连续读取
-            pass
-        success, frame = cap.read()
-        if not success or frame is None:
-            continue
-
-        # 中心裁剪 + 下采样以提升速度，同时保持与清晰度相关的边缘信息
-        h, w = frame.shape[:2]
-        crop_ratio = 0.6
-        cw, ch = int(w * crop_ratio), int(h * crop_ratio)
-        x0 = max(0, (w - cw) // 2)
-        y0 = max(0, (h - ch) // 2)
-        roi = frame[y0:y0 + ch, x0:x0 + cw]
-
-        # 将较大分辨率缩放到最大边 640 像素以内
-        max_side = 640
-        if max(cw, ch) > max_side:
-            scale = max_side / float(max(cw, ch))
-            roi = cv2.resize(roi, (int(cw * scale), int(ch * scale)), interpolation=cv2.INTER_AREA)
-
-        gray = cv2.cvtColor(roi, cv2.COLOR_BGR2GRAY)
-        # 更轻量的拉普拉斯与方差估计
-        lap16 = cv2.Laplacian(gray, cv2.CV_16S, ksize=3)
-        mean, stddev = cv2.meanStdDev(lap16)
-        variance = float((stddev[0][0]) ** 2)
-
-        if variance > best_frame_score:
-            best_frame_score = variance
-            best_frame = frame
-            best_frame_num = pos
-
-    cap.release()
-
-    if best_frame is None:
-        return False, None, "未能分析到任何帧", 0.0, -1
-
-    return True, best_frame, "Sharpest frame computed", best_frame_score, best_frame_num
+    results = iter_sharpest_frames_cv(video_path, [(start_time_sec, end_time_sec)])
+    try:
+        return next(results)
+    finally:
+        results.close()
 
 
 def compute_sharpest_frame_cv_gpu(
     video_path: str,
+    start_time_sec: Optional[float] = None,
+    end_time_sec: Optional[float] = None,
 ) -> Tuple[bool, Optional[np.ndarray], str, float, int]:
     """Compute the sharpest frame using GPU-first decode via OpenCV CUDA, fallback to CPU if unavailable.
 
@@ -272,6 +409,13 @@ def compute_sharpest_frame_cv_gpu(
       * Downscales center ROI to max-side 512 to reduce transfer and compute.
       * Downloads only small Laplacian result when computing variance on CPU.
 
+    Args:
+        video_path: Path to the input video.
+        start_time_sec: Optional window start (seconds). Frames before it are
+            decoded (the GPU reader cannot seek) but not scored.
+        end_time_sec: Optional window end (seconds, inclusive). Decoding stops
+            once the window has been passed.
+
     Returns:
         (ok, best_frame, msg, best_score, best_frame_num)
     """
@@ -291,6 +435,22 @@ def compute_sharpest_frame_cv_gpu(
     except Exception as e:
         return False, None, f"GPU reader init failed: {e}", 0.0, -1
 
+    # 时间窗换算为帧号区间；未指定时覆盖整段视频
+    start_frame = 0
+    end_frame: Optional[int] = None
+    if start_time_sec is not None or end_time_sec is not None:
+        fps = 0.0
+        try:
+            fps = float(getattr(reader.format(), "fps", 0.0) or 0.0)
+        except Exception:
+            fps = 0.0
+        if fps <= 0:
+            fps = 25.0  # Fallback FPS，与 CPU 路径一致
+        if start_time_sec is not None:
+            start_frame = int(max(0.0, start_time_sec) * fps)
+        if end_time_sec is not None:
+            end_frame = int(max(start_time_sec or 0.0, end_time_sec) * fps)
+
     best_frame: Optional[np.ndarray] = None
     best_frame_score: float = -1.0
     best_frame_num: int = -1
@@ -320,6 +480,8 @@ def compute_sharpest_frame_cv_gpu(
             ok, gpu_mat = _next_gpu_frame(reader)
             if not ok or gpu_mat is None:
                 break
+            if end_frame is not None and frame_idx > end_frame:
+                break
 
             # 根据第一帧分辨率动态设置采样步长：1080p 及以上用 3，否则 2
             if not dynamic_stride_set:
@@ -334,8 +496,8 @@ def compute_sharpest_frame_cv_gpu(
                     sample_every = 2
                 dynamic_stride_set = True
 
-            # 跳过未采样帧仅做解码推进
-            if (frame_idx % sample_every) != 0:
+            # 跳过时间窗之前的帧与未采样帧，仅做解码推进
+            if frame_idx < start_frame or (frame_idx % sample_every) != 0:
                 frame_idx += 1
                 continue
 
@@ -18,15 +18,18 @@ import sys
 from pathlib import Path
 from typing import Optional
 
-from PySide6 import QtCore, QtWidgets, QtGui
+from PySide6 import QtWidgets, QtGui
 
 # Ensure imports work both in development and PyInstaller-frozen runtime.
-# In frozen mode, bundled packages are available without modifying sys.path.
-# In development mode, add project root so `concat_tool` can be imported.
-PROJECT_ROOT = Path(__file__).resolve().parents[1]
+# In frozen mode, bundled packages are available without modifying sys.path
+# and the project root is never resolved here.
+# In development mode, add project root so `gui`/`concat_tool` can be imported.
 if not getattr(sys, "frozen", False):
-    if str(PROJECT_ROOT) not in sys.path:
-        sys.path.insert(0, str(PROJECT_ROOT))
+    _root = str(Path(__file__).resolve().parents[1])
+    if _root not in sys.path:
+        sys.path.insert(0, _root)
+
+from gui.precheck import start_preflight_prefetch
 
 # 线程与设置的生命周期已迁移到各自的 Tab 内部，MainWindow 不再直接导入
 from gui.tabs.extract_frames_tab import ExtractFramesTab
@@ -43,30 +46,18 @@ class MainWindow(QtWidgets.QMainWindow):
     This class sets up the form, wires the worker thread, and manages logs and progress.
     """
 
+    # 托盘回退图标：QStyle.standardIcon 每次调用都会查找像素图，缓存后复用
+    _CACHED_TRAY_ICON: Optional[QtGui.QIcon] = None
+    # 初始窗口尺寸：首次构造时按主屏幕可用区域计算，后续重建窗口直接复用
+    _CACHED_INITIAL_SIZE: Optional[tuple[int, int]] = None
+
     def __init__(self) -> None:
         super().__init__()
         self.setWindowTitle("短视频工具V1.0")
         # 初始窗口尺寸加大，尽量使左侧参数全部可见
-        try:
-            screen = QtWidgets.QApplication.primaryScreen()
-            # 缩小整体窗口初始高度，默认约 900x560
-            w, h = 900, 560
-            if screen:
-                r = screen.availableGeometry()
-                # 初始尺寸按屏幕宽度50%、高度45% 计算，整体更紧凑
-                w = max(w, int(r.width() * 0.50))
-                h = max(h, int(r.height() * 0.45))
-                self.resize(w, h)
-            else:
-                self.resize(w, h)
-        except Exception:
-            self.resize(w, h)
+        self.resize(*self._initial_size())
         # 下调最小尺寸，允许用户将窗口缩到更小高度
-        try:
-            self.setMinimumSize(720, 480)
-            # self.setMaximumSize(720, 480)
-        except Exception:
-            pass
+        self.setMinimumSize(720, 480)
 
         # Widgets（改为基于 QTabWidget 的架构）
         self.tabs = QtWidgets.QTabWidget(self)
@@ -74,6 +65,21 @@ class MainWindow(QtWidgets.QMainWindow):
         # 注册tab页
         self._register_feature_tabs(self.tabs)
     
+    @classmethod
+    def _initial_size(cls) -> tuple[int, int]:
+        """Return the initial window size, computed once from the primary screen.
+
+        默认约 900x560；有主屏幕时按可用区域宽度 50%、高度 45% 计算，整体更紧凑。
+        """
+        if cls._CACHED_INITIAL_SIZE is None:
+            screen = QtWidgets.QApplication.primaryScreen()
+            r = screen.availableGeometry() if screen else None
+            if r is not None:
+                cls._CACHED_INITIAL_SIZE = (max(900, int(r.width() * 0.50)), max(560, int(r.height() * 0.45)))
+            else:
+                cls._CACHED_INITIAL_SIZE = (900, 560)
+        return cls._CACHED_INITIAL_SIZE
+
     def _register_feature_tabs(self, tabs: QtWidgets.QTabWidget) -> None:
         """ 批量注册功能标签页到主窗口的 QTabWidget 中。"""
         tabs_mapping = [
@@ -160,11 +166,10 @@ class MainWindow(QtWidgets.QMainWindow):
             self.tray_icon = QtWidgets.QSystemTrayIcon(self)
             # 使用窗口图标或一个标准图标
             icon = self.windowIcon()
-            try:
-                if getattr(icon, 'isNull', lambda: True)():
-                    icon = QtWidgets.QApplication.style().standardIcon(QtWidgets.QStyle.SP_ComputerIcon)
-            except Exception:
-                pass
+            if icon.isNull():
+                if MainWindow._CACHED_TRAY_ICON is None:
+                    MainWindow._CACHED_TRAY_ICON = QtWidgets.QApplication.style().standardIcon(QtWidgets.QStyle.SP_ComputerIcon)
+                icon = MainWindow._CACHED_TRAY_ICON
             self.tray_icon.setIcon(icon)
 
             self.tray_menu = QtWidgets.QMenu(self)
@@ -270,6 +275,8 @@ def main() -> None:
     app = QtWidgets.QApplication(sys.argv)
     w = MainWindow()
     w.show()
+    # 窗口显示后再在后台预取非关键的预检结果，不阻塞首屏
+    start_preflight_prefetch()
     sys.exit(app.exec())
 
 
@@ -12,6 +12,7 @@ Convenience imports are provided so callers can use::
 
     from gui.precheck import (
         run_preflight_checks,
+        start_preflight_prefetch,
         detect_nvidia_gpu,
         show_no_nvidia_dialog,
         license_is_ok,
@@ -23,8 +24,8 @@ Convenience imports are provided so callers can use::
     )
 """
 
-from .preflight import run_preflight_checks
-from .gpu_detect import detect_nvidia_gpu, show_no_nvidia_dialog, list_nvidia_gpus
+from .preflight import run_preflight_checks, start_preflight_prefetch
+from .gpu_detect import detect_nvidia_gpu, record_gpu_proof, show_no_nvidia_dialog, list_nvidia_gpus
 from .license_check import (
     default_license_path,
     license_is_ok,
@@ -34,7 +35,9 @@ from .runtime_paths import resource_path, runtime_base_dir, PROJECT_ROOT
 
 __all__ = [
     "run_preflight_checks",
+    "start_preflight_prefetch",
     "detect_nvidia_gpu",
+    "record_gpu_proof",
     "show_no_nvidia_dialog",
     "list_nvidia_gpus",
     "default_license_path",
@@ -16,13 +16,17 @@ Design goals:
 
 from __future__ import annotations
 
-from dataclasses import dataclass
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, replace
 from typing import Callable, Optional, Tuple
 from pathlib import Path
+import functools
 import shutil
 import os
+import re
 import subprocess
 
+from .gpu_detect import record_gpu_proof
 from .runtime_paths import runtime_base_dir, PROJECT_ROOT
 
 
@@ -56,11 +60,16 @@ def _log(logger: Optional[Callable[[str], None]], msg: str) -> None:
             pass
 
 
+@functools.lru_cache(maxsize=1)
 def _bundled_bin_dir() -> Tuple[Optional[Path], Optional[str]]:
     """Return bundled ffmpeg/bin directory and a source tag.
 
     It first checks the PyInstaller runtime base directory (sys._MEIPASS) and
     then falls back to the repository vendor path.
+
+    The bundled layout is fixed once the process has started, so the result
+    is cached; ``_bundled_bin_dir.cache_clear()`` resets it (e.g. for tests
+    that fake ``sys._MEIPASS``).
     """
     base = runtime_base_dir()
     meipass_bin = base / "ffmpeg" / "bin"
@@ -75,6 +84,8 @@ def _bundled_bin_dir() -> Tuple[Optional[Path], Optional[str]]:
 def _ensure_path_front(dir_path: Path, logger: Optional[Callable[[str], None]] = None) -> None:
     """Prepend a directory to PATH, removing existing duplicates.
 
+    No-op when the directory is already the first PATH entry.
+
     Parameters
     ----------
     dir_path : Path
@@ -85,11 +96,74 @@ def _ensure_path_front(dir_path: Path, logger: Optional[Callable[[str], None]] =
     cur = os.environ.get("PATH", "")
     parts = cur.split(os.pathsep) if cur else []
     d = str(dir_path)
-    parts = [p for p in parts if os.path.abspath(p) != os.path.abspath(d)]
+    # Normalize the target once; each PATH entry is normalized exactly once.
+    # normcase makes the comparison case-insensitive on Windows.
+    target = os.path.normcase(os.path.abspath(d))
+    if parts and os.path.normcase(os.path.abspath(parts[0])) == target:
+        # Already first: skip rewriting os.environ (putenv) on repeat calls
+        return
+    parts = [p for p in parts if os.path.normcase(os.path.abspath(p)) != target]
     os.environ["PATH"] = d + os.pathsep + os.pathsep.join(parts)
     _log(logger, f"PATH updated: {d} is placed at front")
 
 
+@functools.lru_cache(maxsize=8)
+def _resolve_cached(
+    prefer_bundled: bool,
+    allow_system_fallback: bool,
+    path_env: str,
+) -> Tuple[FFResolution, Optional[Path], Tuple[str, ...]]:
+    """Resolve ffmpeg/ffprobe without touching the environment.
+
+    The result only depends on the two flags, the bundled directories and
+    the current PATH (``path_env`` is part of the cache key so that a PATH
+    change invalidates the entry).
+
+    Returns
+    -------
+    Tuple[FFResolution, Optional[Path], Tuple[str, ...]]
+        (resolution, bundled_dir_found, log_messages). Log messages are
+        replayed by the caller so that cache hits log the same decisions.
+    """
+    ffmpeg_path: Optional[str] = None
+    ffprobe_path: Optional[str] = None
+    source = "none"
+    directory: Optional[str] = None
+    bdir: Optional[Path] = None
+    msgs: list[str] = []
+
+    if prefer_bundled:
+        bdir, tag = _bundled_bin_dir()
+        if bdir:
+            msgs.append(f"Bundled ffmpeg directory found: {bdir} ({tag})")
+            # Look up executables inside the bundled dir only, so the result
+            # is guaranteed to come from it regardless of PATH order.
+            ffmpeg_path = shutil.which("ffmpeg", path=str(bdir))
+            ffprobe_path = shutil.which("ffprobe", path=str(bdir))
+            if ffmpeg_path:
+                source = tag or "bundled"
+                directory = str(bdir)
+                msgs.append(f"Resolved ffmpeg from bundled: {ffmpeg_path}")
+            else:
+                msgs.append("Resolved ffmpeg is not in bundled dir; ignoring")
+                ffprobe_path = None
+        else:
+            msgs.append("Bundled ffmpeg directory not found")
+
+    if not ffmpeg_path and allow_system_fallback:
+        ffmpeg_path = shutil.which("ffmpeg", path=path_env)
+        ffprobe_path = shutil.which("ffprobe", path=path_env)
+        if ffmpeg_path:
+            source = "system"
+            directory = os.path.dirname(ffmpeg_path)
+            msgs.append(f"Falling back to system ffmpeg: {ffmpeg_path}")
+        else:
+            msgs.append("System ffmpeg not found")
+
+    res = FFResolution(ffmpeg_path=ffmpeg_path, ffprobe_path=ffprobe_path, source=source, directory=directory)
+    return res, bdir, tuple(msgs)
+
+
 def resolve_ffmpeg_paths(
     prefer_bundled: bool = True,
     allow_system_fallback: bool = False,
@@ -98,6 +172,11 @@ def resolve_ffmpeg_paths(
 ) -> FFResolution:
     """Resolve ffmpeg/ffprobe paths with configurable priority.
 
+    The lookup itself is memoized (see ``_resolve_cached``); repeated calls
+    with the same flags and PATH skip the ``shutil.which`` scans and
+    filesystem checks. Call ``resolve_ffmpeg_paths.cache_clear()`` to force
+    a fresh lookup (e.g. in tests).
+
     Parameters
     ----------
     prefer_bundled : bool
@@ -116,50 +195,43 @@ def resolve_ffmpeg_paths(
     FFResolution
         Resolved paths and the source tag.
     """
-    ffmpeg_path: Optional[str] = None
-    ffprobe_path: Optional[str] = None
-    source = "none"
-    directory: Optional[str] = None
+    res, bdir, msgs = _resolve_cached(
+        bool(prefer_bundled),
+        bool(allow_system_fallback),
+        os.environ.get("PATH", ""),
+    )
+    for m in msgs:
+        _log(logger, m)
+    if bdir and modify_env:
+        _ensure_path_front(bdir, logger)
+    # Return a copy so callers cannot mutate the cached instance
+    return replace(res)
 
-    if prefer_bundled:
-        bdir, tag = _bundled_bin_dir()
-        if bdir:
-            _log(logger, f"Bundled ffmpeg directory found: {bdir} ({tag})")
-            if modify_env:
-                _ensure_path_front(bdir, logger)
-            ffmpeg_path = shutil.which("ffmpeg")
-            ffprobe_path = shutil.which("ffprobe")
-            # Verify resolved paths come from bundled dir
-            try:
-                if ffmpeg_path and os.path.abspath(os.path.dirname(ffmpeg_path)) == os.path.abspath(str(bdir)):
-                    source = tag or "bundled"
-                    directory = str(bdir)
-                    _log(logger, f"Resolved ffmpeg from bundled: {ffmpeg_path}")
-                else:
-                    _log(logger, "Resolved ffmpeg is not in bundled dir; ignoring")
-                    ffmpeg_path = None
-                    ffprobe_path = None
-            except Exception:
-                ffmpeg_path = None
-                ffprobe_path = None
-        else:
-            _log(logger, "Bundled ffmpeg directory not found")
 
-    if not ffmpeg_path and allow_system_fallback:
-        ffmpeg_path = shutil.which("ffmpeg")
-        ffprobe_path = shutil.which("ffprobe")
-        if ffmpeg_path:
-            source = "system"
-            directory = os.path.dirname(ffmpeg_path)
-            _log(logger, f"Falling back to system ffmpeg: {ffmpeg_path}")
-        else:
-            _log(logger, "System ffmpeg not found")
-
-    return FFResolution(ffmpeg_path=ffmpeg_path, ffprobe_path=ffprobe_path, source=source, directory=directory)
+resolve_ffmpeg_paths.cache_clear = _resolve_cached.cache_clear  # type: ignore[attr-defined]
 
 
 from utils.common_utils import get_subprocess_silent_kwargs
 
+# Silent-spawn kwargs (STARTUPINFO + CREATE_NO_WINDOW on Windows, empty
+# elsewhere) built once; subprocess copies STARTUPINFO per call, so sharing
+# the instance between concurrent probes is safe.
+_SILENT_KWARGS = get_subprocess_silent_kwargs()
+
+
+def _run_cmd_silent_bytes(cmd: list[str], timeout: int = 8) -> bytes:
+    """Run a command and return its stdout (or stderr if empty) as raw bytes.
+
+    On Windows, suppress console window popups. Used where the caller only
+    scans for ASCII tokens and does not need the output decoded.
+    """
+    try:
+        res = subprocess.run(cmd, capture_output=True, timeout=timeout, **_SILENT_KWARGS)
+        out = res.stdout.strip() or res.stderr.strip()
+        return out or "<无输出>".encode("utf-8")
+    except Exception as e:
+        return f"<执行失败: {e}>".encode("utf-8")
+
 
 def _run_cmd_silent(cmd: list[str], timeout: int = 8) -> str:
     """Run a command and return combined stdout/stderr output.
@@ -167,15 +239,42 @@ def _run_cmd_silent(cmd: list[str], timeout: int = 8) -> str:
     On Windows, suppress console window popups.
     """
     try:
-        kwargs = get_subprocess_silent_kwargs()
-        res = subprocess.run(cmd, capture_output=True, text=True, timeout=timeout, **kwargs)
+        res = subprocess.run(cmd, capture_output=True, text=True, timeout=timeout, **_SILENT_KWARGS)
         out = res.stdout.strip() or res.stderr.strip()
         return out or "<无输出>"
     except Exception as e:
         return f"<执行失败: {e}>"
 
 
-def get_ffmpeg_versions(ffmpeg_path: Optional[str], ffprobe_path: Optional[str], timeout: int = 8) -> Tuple[str, str]:
+# detect_nvenc 在原始字节上一次扫描 h264_nvenc / hevc_nvenc
+_NVENC_RE = re.compile(rb"h(?:264|evc)_nvenc")
+
+
+@functools.lru_cache(maxsize=8)
+def _version_output(exe_path: str, mtime_ns: int, timeout: int) -> str:
+    """Return ``<exe> -version`` output, cached per executable and mtime.
+
+    ``mtime_ns`` is only part of the cache key: replacing the binary changes
+    it and forces a fresh run.
+    """
+    return _run_cmd_silent([exe_path, "-version"], timeout)
+
+
+def _version_of(exe_path: str, timeout: int) -> str:
+    try:
+        mtime_ns = os.stat(exe_path).st_mtime_ns
+    except OSError:
+        # Unstat-able path: run uncached so the failure is reported as-is
+        return _run_cmd_silent([exe_path, "-version"], timeout)
+    return _version_output(exe_path, mtime_ns, timeout)
+
+
+def get_ffmpeg_versions(
+    ffmpeg_path: Optional[str],
+    ffprobe_path: Optional[str],
+    timeout: int = 8,
+    lazy: bool = False,
+) -> Tuple[str, str]:
     """Return version outputs for ffmpeg and ffprobe.
 
     Parameters
@@ -186,20 +285,34 @@ def get_ffmpeg_versions(ffmpeg_path: Optional[str], ffprobe_path: Optional[str],
         Path to ffprobe. If None, returns a not-found marker.
     timeout : int
         Subprocess timeout in seconds.
+    lazy : bool
+        If True, do not execute the binaries; return "<name> @ <path>"
+        strings instead. Use this on non user-facing paths that only need to
+        know which executables were resolved. When False, the ``-version``
+        output is cached per executable path and modification time, so
+        repeated diagnostics do not re-spawn processes.
 
     Returns
     -------
     Tuple[str, str]
         (ffmpeg_version_output, ffprobe_version_output)
     """
-    ffmpeg_ver = _run_cmd_silent([ffmpeg_path, "-version"], timeout) if ffmpeg_path else "(未找到 ffmpeg)"
-    ffprobe_ver = _run_cmd_silent([ffprobe_path, "-version"], timeout) if ffprobe_path else "(未找到 ffprobe)"
+    if lazy:
+        ffmpeg_ver = f"ffmpeg @ {ffmpeg_path}" if ffmpeg_path else "(未找到 ffmpeg)"
+        ffprobe_ver = f"ffprobe @ {ffprobe_path}" if ffprobe_path else "(未找到 ffprobe)"
+        return ffmpeg_ver, ffprobe_ver
+    ffmpeg_ver = _version_of(ffmpeg_path, timeout) if ffmpeg_path else "(未找到 ffmpeg)"
+    ffprobe_ver = _version_of(ffprobe_path, timeout) if ffprobe_path else "(未找到 ffprobe)"
     return ffmpeg_ver, ffprobe_ver
 
 
 def detect_nvenc(ffmpeg_path: Optional[str], timeout: int = 8) -> Tuple[bool, str, str]:
     """Detect NVENC availability using ffmpeg outputs.
 
+    ffmpeg treats ``-encoders`` and ``-hwaccels`` as print-and-exit options,
+    so they cannot share one invocation; the two probes run concurrently
+    instead, making the wall time that of the slower one.
+
     Parameters
     ----------
     ffmpeg_path : Optional[str]
@@ -207,6 +320,10 @@ def detect_nvenc(ffmpeg_path: Optional[str], timeout: int = 8) -> Tuple[bool, st
     timeout : int
         Subprocess timeout.
 
+    Only the ffmpeg build is inspected: common builds list NVENC encoders
+    even without an NVIDIA GPU, so a positive result is not hardware proof
+    (see ``nvenc_encode_works``).
+
     Returns
     -------
     Tuple[bool, str, str]
@@ -214,11 +331,52 @@ def detect_nvenc(ffmpeg_path: Optional[str], timeout: int = 8) -> Tuple[bool, st
     """
     if not ffmpeg_path:
         return False, "", ""
-    encoders = _run_cmd_silent([ffmpeg_path, "-hide_banner", "-encoders"], timeout)
-    hwaccels = _run_cmd_silent([ffmpeg_path, "-hide_banner", "-hwaccels"], timeout)
-    has_h264 = "h264_nvenc" in encoders
-    has_hevc = "hevc_nvenc" in encoders
-    return (has_h264 or has_hevc), encoders, hwaccels
+    with ThreadPoolExecutor(max_workers=1) as ex:
+        hw_future = ex.submit(_run_cmd_silent, [ffmpeg_path, "-hide_banner", "-hwaccels"], timeout)
+        enc_bytes = _run_cmd_silent_bytes([ffmpeg_path, "-hide_banner", "-encoders"], timeout)
+        hwaccels = hw_future.result()
+    # 直接在原始字节上查找标记，判定不依赖解码
+    nvenc_ok = _NVENC_RE.search(enc_bytes) is not None
+    encoders = enc_bytes.decode("utf-8", errors="replace")
+    return nvenc_ok, encoders, hwaccels
+
+
+def nvenc_encode_works(ffmpeg_path: Optional[str], timeout: int = 8) -> bool:
+    """Encode one blank frame with ``h264_nvenc`` to prove NVENC hardware.
+
+    Unlike ``detect_nvenc`` (which only reads the encoder list), this needs
+    a working NVIDIA GPU and driver. On success the result is recorded via
+    ``gpu_detect.record_gpu_proof`` so ``detect_nvidia_gpu`` can skip its
+    own probes.
+
+    Parameters
+    ----------
+    ffmpeg_path : Optional[str]
+        Path to ffmpeg executable. If None, returns False.
+    timeout : int
+        Subprocess timeout.
+
+    Returns
+    -------
+    bool
+        True only when the test encode exits successfully.
+    """
+    if not ffmpeg_path:
+        return False
+    cmd = [
+        ffmpeg_path, "-hide_banner", "-loglevel", "error",
+        "-f", "lavfi", "-i", "nullsrc=s=256x256",
+        "-frames:v", "1", "-c:v", "h264_nvenc", "-f", "null", "-",
+    ]
+    try:
+        res = subprocess.run(cmd, capture_output=True, timeout=timeout, **_SILENT_KWARGS)
+    except Exception:
+        return False
+    if res.returncode != 0:
+        return False
+    # 实际编码成功才证明存在 NVIDIA 显卡，后续 GPU 检测无需再启动 nvidia-smi
+    record_gpu_proof("nvenc")
+    return True
 
 def allow_system_fallback_env() -> bool:
     """Check env var FFMPEG_DEV_FALLBACK to allow system ffmpeg fallback in dev.
@@ -239,5 +397,6 @@ __all__ = [
     "resolve_ffmpeg_paths",
     "get_ffmpeg_versions",
     "detect_nvenc",
+    "nvenc_encode_works",
     "allow_system_fallback_env",
 ]
\ No newline at end of file
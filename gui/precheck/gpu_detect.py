@@ -7,18 +7,192 @@ it can be reused in different contexts.
 
 from __future__ import annotations
 
-import platform
+import functools
+import os
+import re
 import shutil
 import subprocess
+import sys
+from typing import TYPE_CHECKING
 from utils.common_utils import get_subprocess_silent_kwargs
-from PySide6 import QtWidgets
+
+if TYPE_CHECKING:
+    from PySide6 import QtWidgets
+
+# Silent-spawn kwargs for probe subprocesses, built once (see utils.common_utils).
+_SILENT_KWARGS = get_subprocess_silent_kwargs()
+
+# Platform tag ("windows" / "darwin" / "linux"), derived from sys.platform
+# so the `platform` module is never imported on startup.
+if sys.platform.startswith("win"):
+    _SYSTEM = "windows"
+elif sys.platform.startswith("linux"):
+    _SYSTEM = "linux"
+else:
+    _SYSTEM = sys.platform
+
+
+# 各平台输出中查找 "nvidia"（不区分大小写），免去整段文本 lower() 复制
+_NVIDIA_RE = re.compile("nvidia", re.IGNORECASE)
+
+
+@functools.lru_cache(maxsize=None)
+def _which(name: str) -> str | None:
+    """Return ``shutil.which(name)``, cached for the process lifetime."""
+    return shutil.which(name)
+
+
+# Display adapter device class (GUID_DEVCLASS_DISPLAY) under the Windows registry.
+_DISPLAY_CLASS_KEY = r"SYSTEM\CurrentControlSet\Control\Class\{4d36e968-e325-11ce-bfc1-08002be10318}"
+
+
+def _windows_display_adapters() -> list[str] | None:
+    """Return display adapter names from the Windows registry.
+
+    Reads the ``DriverDesc`` value of every subkey under the display device
+    class. This avoids starting PowerShell (hundreds of milliseconds of
+    cold start) just to list video controllers.
+
+    Returns
+    -------
+    list[str] | None
+        Adapter names, or None when the registry cannot be read (non-Windows
+        or missing key), in which case callers fall back to PowerShell.
+    """
+    try:
+        import winreg
+    except ImportError:
+        return None
+    names: list[str] = []
+    try:
+        with winreg.OpenKey(winreg.HKEY_LOCAL_MACHINE, _DISPLAY_CLASS_KEY) as cls_key:
+            index = 0
+            while True:
+                try:
+                    sub_name = winreg.EnumKey(cls_key, index)
+                except OSError:
+                    break
+                index += 1
+                try:
+                    with winreg.OpenKey(cls_key, sub_name) as sub_key:
+                        desc, _ = winreg.QueryValueEx(sub_key, "DriverDesc")
+                except OSError:
+                    # Non-device subkeys such as "Properties" have no DriverDesc
+                    continue
+                desc = str(desc).strip()
+                if desc:
+                    names.append(desc)
+    except OSError:
+        return None
+    return names
+
+
+# PCI vendor id of NVIDIA
+_NVIDIA_PCI_VENDOR = "10de"
+_SYSFS_PCI_DEVICES = "/sys/bus/pci/devices"
+_PCI_ENUM_KEY = r"SYSTEM\CurrentControlSet\Enum\PCI"
+
+
+def _has_nvidia_pci() -> bool | None:
+    """Check for an NVIDIA PCI device without spawning a subprocess.
+
+    - Linux: read ``/sys/bus/pci/devices/*/vendor`` looking for ``0x10de``.
+    - Windows: enumerate ``HKLM\\SYSTEM\\CurrentControlSet\\Enum\\PCI``
+      subkeys (``VEN_10DE&DEV_...``).
+
+    Returns
+    -------
+    bool | None
+        True/False when the PCI inventory could be read, None when it is
+        unavailable (other platforms, permissions), meaning "unknown".
+    """
+    if _SYSTEM == "linux":
+        try:
+            with os.scandir(_SYSFS_PCI_DEVICES) as it:
+                for entry in it:
+                    try:
+                        with open(os.path.join(entry.path, "vendor"), "r") as f:
+                            if f.read().strip().lower() == "0x" + _NVIDIA_PCI_VENDOR:
+                                return True
+                    except OSError:
+                        continue
+        except OSError:
+            return None
+        return False
+    if _SYSTEM == "windows":
+        try:
+            import winreg
+        except ImportError:
+            return None
+        marker = "VEN_" + _NVIDIA_PCI_VENDOR.upper()
+        try:
+            with winreg.OpenKey(winreg.HKEY_LOCAL_MACHINE, _PCI_ENUM_KEY) as pci_key:
+                index = 0
+                while True:
+                    try:
+                        sub_name = winreg.EnumKey(pci_key, index)
+                    except OSError:
+                        break
+                    index += 1
+                    if marker in sub_name.upper():
+                        return True
+        except OSError:
+            return None
+        return False
+    return None
+
+
+def _powershell_video_controllers() -> str:
+    """Return Win32_VideoController names via PowerShell (slow fallback)."""
+    ps_cmd = [
+        "powershell",
+        "-NoProfile",
+        "-ExecutionPolicy", "Bypass",
+        "-Command",
+        "Get-CimInstance Win32_VideoController | Select-Object -ExpandProperty Name",
+    ]
+    out = subprocess.check_output(ps_cmd, stderr=subprocess.STDOUT, timeout=3, **_SILENT_KWARGS)
+    return out.decode(errors="ignore")
+
+
+# 已证明存在 NVIDIA 显卡的来源标记（如 "nvenc"），由其他检测路径登记
+_GPU_PROOF: set[str] = set()
+
+
+def record_gpu_proof(source: str) -> None:
+    """Record that another probe has proven an NVIDIA GPU is present.
+
+    For example, ``nvenc_encode_works`` calls this with ``"nvenc"`` once a
+    one-frame ``h264_nvenc`` test encode succeeds. ``detect_nvidia_gpu`` then returns
+    True without spawning ``nvidia-smi``.
+
+    Parameters
+    ----------
+    source : str
+        Short tag naming the probe that produced the proof.
+    """
+    _GPU_PROOF.add(source)
+
 
 def detect_nvidia_gpu() -> bool:
     """Detect whether an NVIDIA GPU is present on the system.
 
+    If another probe already proved a GPU is present (see
+    ``record_gpu_proof``), returns True immediately. Otherwise the GPU
+    inventory does not change during a process lifetime, so the result of
+    the first probe is cached; later calls return immediately without
+    spawning subprocesses. Use ``detect_nvidia_gpu.cache_clear()`` to force
+    a re-probe.
+
     Strategy (cross-platform):
-    1) Prefer `nvidia-smi` when available (Windows/Linux). If it lists GPUs, return True.
-    2) Windows fallback: query Win32_VideoController via PowerShell and check adapter names.
+    0) Read the PCI inventory (sysfs on Linux, registry on Windows). It is
+       only a hint: WSL2 and some VM/passthrough setups expose the GPU
+       without an NVIDIA (0x10de) PCI device, so a negative answer only
+       skips the slow fallbacks below (2-4), never `nvidia-smi`.
+    1) Prefer `nvidia-smi` when available (Windows/Linux; skipped on macOS,
+       where NVIDIA drivers are no longer shipped). If it lists GPUs, return True.
+    2) Windows fallback: read display adapter names from the registry
+       (PowerShell Win32_VideoController query only if the registry is unreadable).
     3) macOS: run `system_profiler SPDisplaysDataType` to find entries containing "NVIDIA".
     4) Linux fallback: use `lspci` output to grep for "NVIDIA".
 
@@ -27,12 +201,25 @@ def detect_nvidia_gpu() -> bool:
     bool
         True if an NVIDIA GPU appears to be present; False otherwise.
     """
+    if _GPU_PROOF:
+        return True
+    return _probe_nvidia_gpu()
+
+
+@functools.lru_cache(maxsize=1)
+def _probe_nvidia_gpu() -> bool:
+    """Run the platform probes behind ``detect_nvidia_gpu`` (cached)."""
+    # 0) PCI 厂商号预检仅作提示：WSL2（/dev/dxg）及部分虚拟机/直通环境中显卡不以
+    #    0x10de PCI 设备出现，因此结果为 False 时仍运行 nvidia-smi，只跳过较慢的兜底探测
+    pci_hint = _has_nvidia_pci()
     try:
+        system = _SYSTEM
+
         # 1) Prefer nvidia-smi if available
-        nvsmi = shutil.which("nvidia-smi")
+        nvsmi = _which("nvidia-smi") if system != "darwin" else None
         if nvsmi:
             try:
-                out = subprocess.check_output([nvsmi, "-L"], stderr=subprocess.STDOUT, timeout=3, **get_subprocess_silent_kwargs())
+                out = subprocess.check_output([nvsmi, "-L"], stderr=subprocess.STDOUT, timeout=3, **_SILENT_KWARGS)
                 text = out.decode(errors="ignore")
                 if any("GPU" in line for line in text.splitlines()):
                     return True
@@ -41,21 +228,18 @@ def detect_nvidia_gpu() -> bool:
             except Exception:
                 pass
 
-        system = platform.system().lower()
+        if pci_hint is False:
+            return False
 
-        # 2) Windows fallback: PowerShell query of video controllers
+        # 2) Windows fallback: registry first, PowerShell only if unreadable
         if system == "windows":
             try:
-                ps_cmd = [
-                    "powershell",
-                    "-NoProfile",
-                    "-ExecutionPolicy", "Bypass",
-                    "-Command",
-                    "Get-CimInstance Win32_VideoController | Select-Object -ExpandProperty Name",
-                ]
-                out = subprocess.check_output(ps_cmd, stderr=subprocess.STDOUT, timeout=3, **get_subprocess_silent_kwargs())
-                text = out.decode(errors="ignore").lower()
-                if "nvidia" in text:
+                adapters = _windows_display_adapters()
+                if adapters is not None:
+                    text = "\n".join(adapters)
+                else:
+                    text = _powershell_video_controllers()
+                if _NVIDIA_RE.search(text):
                     return True
             except subprocess.TimeoutExpired:
                 pass
@@ -63,11 +247,11 @@ def detect_nvidia_gpu() -> bool:
                 pass
 
         # 3) macOS: system_profiler
-        if system == "darwin":
+        elif system == "darwin":
             try:
-                out = subprocess.check_output(["system_profiler", "SPDisplaysDataType"], stderr=subprocess.STDOUT, timeout=4, **get_subprocess_silent_kwargs())
-                text = out.decode(errors="ignore").lower()
-                if "nvidia" in text:
+                out = subprocess.check_output(["system_profiler", "SPDisplaysDataType"], stderr=subprocess.STDOUT, timeout=4, **_SILENT_KWARGS)
+                text = out.decode(errors="ignore")
+                if _NVIDIA_RE.search(text):
                     return True
             except subprocess.TimeoutExpired:
                 pass
@@ -75,13 +259,13 @@ def detect_nvidia_gpu() -> bool:
                 pass
 
         # 4) Linux: lspci fallback
-        if system == "linux":
+        elif system == "linux":
             try:
-                lspci = shutil.which("lspci")
+                lspci = _which("lspci")
                 if lspci:
-                    out = subprocess.check_output([lspci], stderr=subprocess.STDOUT, timeout=3, **get_subprocess_silent_kwargs())
-                    text = out.decode(errors="ignore").lower()
-                    if "nvidia" in text:
+                    out = subprocess.check_output([lspci], stderr=subprocess.STDOUT, timeout=3, **_SILENT_KWARGS)
+                    text = out.decode(errors="ignore")
+                    if _NVIDIA_RE.search(text):
                         return True
             except subprocess.TimeoutExpired:
                 pass
@@ -93,6 +277,40 @@ def detect_nvidia_gpu() -> bool:
     return False
 
 
+detect_nvidia_gpu.cache_clear = _probe_nvidia_gpu.cache_clear  # type: ignore[attr-defined]
+
+
+_NO_NV_MSG = "该程序是使用navida显卡来处理视频，请升级显卡，cpu渲染效率太低"
+
+# 未检测到 NVIDIA 显卡的提示框，首次使用时构建，之后复用
+_NO_NV_BOX: QtWidgets.QMessageBox | None = None
+
+
+def _no_nvidia_box(app: QtWidgets.QApplication) -> QtWidgets.QMessageBox:
+    """Return the shared no-NVIDIA message box, building it on first use.
+
+    The box is released when the application is about to quit so no
+    parentless widget outlives the QApplication.
+    """
+    global _NO_NV_BOX
+    if _NO_NV_BOX is None:
+        from PySide6 import QtWidgets
+
+        _NO_NV_BOX = QtWidgets.QMessageBox(
+            QtWidgets.QMessageBox.Critical,
+            "硬件要求",
+            _NO_NV_MSG,
+            QtWidgets.QMessageBox.StandardButton.Ok,
+        )
+        app.aboutToQuit.connect(_release_no_nvidia_box)
+    return _NO_NV_BOX
+
+
+def _release_no_nvidia_box() -> None:
+    global _NO_NV_BOX
+    _NO_NV_BOX = None
+
+
 def show_no_nvidia_dialog(app: QtWidgets.QApplication) -> None:
     """显示未检测到 NVIDIA 显卡的阻塞对话框，并退出应用。
 
@@ -102,17 +320,9 @@ def show_no_nvidia_dialog(app: QtWidgets.QApplication) -> None:
         Qt 应用实例；在用户确认后调用 app.quit() 退出。
     """
     try:
-        msg = (
-            "该程序是使用navida显卡来处理视频，请升级显卡，cpu渲染效率太低"
-        )
-        QtWidgets.QMessageBox.critical(
-            None,
-            "硬件要求",
-            msg,
-            QtWidgets.QMessageBox.StandardButton.Ok,
-        )
+        _no_nvidia_box(app).exec()
     except Exception:
-        print("[启动检查] 未检测到NVIDIA显卡：该程序是使用navida显卡来处理视频，请升级显卡，cpu渲染效率太低")
+        print(f"[启动检查] 未检测到NVIDIA显卡：{_NO_NV_MSG}")
     try:
         app.quit()
     except Exception:
@@ -133,11 +343,13 @@ def list_nvidia_gpus() -> list[str]:
     """
     names: list[str] = []
     try:
-        # Prefer nvidia-smi if available
-        nvsmi = shutil.which("nvidia-smi")
+        system = _SYSTEM
+
+        # Prefer nvidia-smi if available (not on macOS)
+        nvsmi = _which("nvidia-smi") if system != "darwin" else None
         if nvsmi:
             try:
-                out = subprocess.check_output([nvsmi, "-L"], stderr=subprocess.STDOUT, timeout=3, **get_subprocess_silent_kwargs())
+                out = subprocess.check_output([nvsmi, "-L"], stderr=subprocess.STDOUT, timeout=3, **_SILENT_KWARGS)
                 text = out.decode(errors="ignore")
                 for line in text.splitlines():
                     # Example: GPU 0: NVIDIA GeForce RTX 3080 (UUID: GPU-...)
@@ -153,20 +365,12 @@ def list_nvidia_gpus() -> list[str]:
             except Exception:
                 pass
 
-        system = platform.system().lower()
-
         if system == "windows":
             try:
-                ps_cmd = [
-                    "powershell",
-                    "-NoProfile",
-                    "-ExecutionPolicy", "Bypass",
-                    "-Command",
-                    "Get-CimInstance Win32_VideoController | Select-Object -ExpandProperty Name",
-                ]
-                out = subprocess.check_output(ps_cmd, stderr=subprocess.STDOUT, timeout=3, **get_subprocess_silent_kwargs())
-                text = out.decode(errors="ignore")
-                for line in text.splitlines():
+                adapters = _windows_display_adapters()
+                if adapters is None:
+                    adapters = _powershell_video_controllers().splitlines()
+                for line in adapters:
                     l = line.strip()
                     if l and "nvidia" in l.lower():
                         names.append(l)
@@ -177,7 +381,7 @@ def list_nvidia_gpus() -> list[str]:
 
         elif system == "darwin":
             try:
-                out = subprocess.check_output(["system_profiler", "SPDisplaysDataType"], stderr=subprocess.STDOUT, timeout=4, **get_subprocess_silent_kwargs())
+                out = subprocess.check_output(["system_profiler", "SPDisplaysDataType"], stderr=subprocess.STDOUT, timeout=4, **_SILENT_KWARGS)
                 text = out.decode(errors="ignore")
                 # Extract lines containing "Chipset Model:" or vendor lines with NVIDIA
                 for line in text.splitlines():
@@ -195,9 +399,9 @@ def list_nvidia_gpus() -> list[str]:
 
         elif system == "linux":
             try:
-                lspci = shutil.which("lspci")
+                lspci = _which("lspci")
                 if lspci:
-                    out = subprocess.check_output([lspci], stderr=subprocess.STDOUT, timeout=3, **get_subprocess_silent_kwargs())
+                    out = subprocess.check_output([lspci], stderr=subprocess.STDOUT, timeout=3, **_SILENT_KWARGS)
                     text = out.decode(errors="ignore")
                     for line in text.splitlines():
                         if "nvidia" in line.lower():
@@ -214,4 +418,4 @@ def list_nvidia_gpus() -> list[str]:
     return names
 
 
-__all__ = ["detect_nvidia_gpu", "show_no_nvidia_dialog", "list_nvidia_gpus"]
\ No newline at end of file
+__all__ = ["detect_nvidia_gpu", "record_gpu_proof", "show_no_nvidia_dialog", "list_nvidia_gpus"]
\ No newline at end of file
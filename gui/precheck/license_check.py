@@ -14,23 +14,83 @@ environments.
 
 from __future__ import annotations
 
+import functools
+import os
 import sys
-import random
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+from typing import TYPE_CHECKING
 
-from PySide6 import QtCore, QtWidgets
+if TYPE_CHECKING:
+    from PySide6 import QtWidgets
+
+from .runtime_paths import resource_path, IS_FROZEN, PROJECT_ROOT
 
 # Ensure imports work both in development and PyInstaller-frozen runtime.
-PROJECT_ROOT = Path(__file__).resolve().parents[2]
-if not getattr(sys, "frozen", False):
+if not IS_FROZEN:
     if str(PROJECT_ROOT) not in sys.path:
         sys.path.insert(0, str(PROJECT_ROOT))
 
-from gui.crypto_tool import verify_license, machine_code  # type: ignore
-from .runtime_paths import resource_path, PROJECT_ROOT
+# gui.crypto_tool（wmi、pycryptodome 等）较重，仅在校验/失败弹窗时按需导入
+
+# 二维码候选图片扩展名（元组供 str.endswith 一次匹配）
+_QR_EXTS = (".png", ".jpg", ".jpeg", ".bmp", ".gif")
+
+
+
+@functools.lru_cache(maxsize=1)
+def _runtime_dir() -> Path:
+    """Return the directory holding license.dat/last_run.dat (cached).
+
+    Frozen: the directory of the running .exe; development: PROJECT_ROOT.
+    Resolved once per process so repeated checks skip ``Path.resolve()``.
+    """
+    if IS_FROZEN:
+        return Path(sys.executable).resolve().parent
+    return PROJECT_ROOT
+
+
+@functools.lru_cache(maxsize=1)
+def _cached_hwid() -> str | None:
+    """Return the machine fingerprint, computed once per process.
+
+    ``machine_code.get_stable_hardware_id`` walks WMI, which is slow; the
+    fingerprint cannot change while the app runs.
+    """
+    from gui.crypto_tool import machine_code  # type: ignore
+
+    return machine_code.get_stable_hardware_id()
+
+
+def _hwid_in_worker() -> str | None:
+    """Compute ``_cached_hwid`` on a worker thread.
 
+    WMI is COM based and each thread must initialise COM before use, so
+    CoInitialize/CoUninitialize bracket the call when pywin32 is present.
+    """
+    try:
+        import pythoncom  # type: ignore
+    except ImportError:
+        pythoncom = None
+    if pythoncom is not None:
+        pythoncom.CoInitialize()
+    try:
+        return _cached_hwid()
+    finally:
+        if pythoncom is not None:
+            pythoncom.CoUninitialize()
 
 
+def warm_license_caches() -> None:
+    """Populate the path and QR-resource caches used by the license checks.
+
+    Safe to call from a background thread: it only resolves the runtime
+    directory and scans the bundled wechat directory, so a later failure
+    dialog opens without touching the disk for them.
+    """
+    _runtime_dir()
+    _scan_wechat_dir()
+
 
 def default_license_path() -> Path:
     """Return the default location of license.dat for current runtime.
@@ -47,12 +107,7 @@ def default_license_path() -> Path:
     Path
         Path to the expected license.dat location (may or may not exist).
     """
-    try:
-        if getattr(sys, "frozen", False):
-            return Path(sys.executable).resolve().parent / "license.dat"
-        return PROJECT_ROOT / "license.dat"
-    except Exception:
-        return Path(sys.argv[0]).resolve().parent / "license.dat"
+    return _runtime_dir() / "license.dat"
 
 
 def license_is_ok() -> bool:
@@ -68,21 +123,49 @@ def license_is_ok() -> bool:
         True if license verification succeeds; False otherwise.
     """
     try:
-        lic_path = default_license_path()
+        base = _runtime_dir()
+        lic_path = base / "license.dat"
+        # 未放置 license.dat 时直接判定失败，无需导入 crypto_tool 并走验签流程
+        if not lic_path.is_file():
+            return False
+
+        from gui.crypto_tool import verify_license  # type: ignore
+
         # Place timestamp file alongside license for consistency
-        if getattr(sys, "frozen", False):
-            ts_file = Path(sys.executable).resolve().parent / "last_run.dat"
-        else:
-            ts_file = PROJECT_ROOT / "last_run.dat"
         ok = verify_license.verify_license(
             license_path=lic_path,
-            timestamp_file=ts_file,
+            timestamp_file=base / "last_run.dat",
         )
         return bool(ok)
     except Exception:
         return False
 
 
+@functools.lru_cache(maxsize=1)
+def _scan_wechat_dir() -> tuple[tuple[str, ...], tuple[Path, ...]]:
+    """Scan the bundled wechat resource directory once (cached).
+
+    The directory ships with the app and does not change at runtime, so
+    the failure dialog reuses this result instead of re-listing it.
+
+    Returns
+    -------
+    tuple[tuple[str, ...], tuple[Path, ...]]
+        (all entry names for diagnostics, QR image candidates)
+    """
+    names: list[str] = []
+    qr_candidates: list[Path] = []
+    try:
+        with os.scandir(resource_path("gui", "wechat")) as it:
+            for entry in it:
+                names.append(entry.name)
+                if entry.is_file(follow_symlinks=False) and entry.name.lower().endswith(_QR_EXTS):
+                    qr_candidates.append(Path(entry.path))
+    except OSError:
+        pass
+    return tuple(names), tuple(qr_candidates)
+
+
 def show_license_failure_dialog(app: QtWidgets.QApplication) -> None:
     """Show the authorization failure dialog and quit the application.
 
@@ -94,22 +177,25 @@ def show_license_failure_dialog(app: QtWidgets.QApplication) -> None:
     app : QtWidgets.QApplication
         The Qt application instance.
     """
+    # 机器码（WMI，较慢）在后台计算，与弹窗构建及用户阅读时间重叠；
+    # 执行器在弹窗关闭前保持可用，计算失败时点击按钮可重新提交
+    executor = ThreadPoolExecutor(max_workers=1)
+    hwid_future = executor.submit(_hwid_in_worker)
+
     try:
+        # Qt 仅在失败弹窗路径中使用，延迟导入使 license_is_ok 等纯校验函数不依赖 PySide6
+        from PySide6 import QtCore, QtGui, QtWidgets
+
         # 构造富文本消息并随机挑选二维码图片
         wechat_dir = resource_path("gui", "wechat")
-        qr_candidates = []
-        try:
-            if wechat_dir.exists():
-                for p in wechat_dir.iterdir():
-                    if p.is_file() and p.suffix.lower() in {".png", ".jpg", ".jpeg", ".bmp", ".gif"}:
-                        qr_candidates.append(p)
-        except Exception:
-            pass
-        qr_html = ""
+        # 目录中全部条目名供未找到二维码时的诊断信息复用；结果按进程缓存
+        names, qr_candidates = _scan_wechat_dir()
+        qr_path = None
         debug_html = ""
         if qr_candidates:
+            import random  # 仅失败弹窗用到，按需导入
+
             qr_path = random.choice(qr_candidates)
-            qr_html = f"<div style='margin:8px; text-align:center;'>\n<img src='file:///{qr_path.as_posix()}' style='max-width:160px;'/>\n</div>"
         else:
             # 当没有找到任何图片时，在弹窗中加入诊断信息：显示目录路径和现有文件列表
             try:
@@ -122,12 +208,6 @@ def show_license_failure_dialog(app: QtWidgets.QApplication) -> None:
                         "</div>"
                     )
                 else:
-                    names: list[str] = []
-                    for p in wechat_dir.iterdir():
-                        try:
-                            names.append(p.name)
-                        except Exception:
-                            pass
                     if names:
                         list_html = _html_escape(
                             ", ".join(sorted(names))[:2000]
@@ -142,12 +222,12 @@ def show_license_failure_dialog(app: QtWidgets.QApplication) -> None:
             except Exception:
                 pass
 
+        # 文字与二维码分开：二维码用 QPixmap 直接显示，不经过富文本的 HTML 解析与图片加载
         msg_html = (
             "未获得授权<br><br>"
             "请点击按钮生成<font color='red'>【专属口令】</font>并发送给管理员 <br>"
-            + qr_html + debug_html + "<br>" +
-            "微信扫码添加管理员"
         )
+        footer_html = debug_html + "<br>" + "微信扫码添加管理员"
 
         dialog = QtWidgets.QDialog()
         dialog.setWindowTitle("授权校验失败")
@@ -162,19 +242,14 @@ def show_license_failure_dialog(app: QtWidgets.QApplication) -> None:
         dialog.activateWindow()
         dialog.raise_()
 
-        class _BlockCloseEsc(QtCore.QObject):
-            def eventFilter(self, obj, event):  # type: ignore[override]
-                et = event.type()
-                if et == QtCore.QEvent.KeyPress:
-                    try:
-                        if event.key() == QtCore.Qt.Key_Escape:
-                            return True
-                    except Exception:
-                        pass
-                return False
+        # 屏蔽 Esc 关闭：只覆盖按键处理，其余事件不经过额外的事件过滤器
+        def _key_press(event, _base=dialog.keyPressEvent) -> None:
+            if event.key() == QtCore.Qt.Key_Escape:
+                event.accept()
+                return
+            _base(event)
 
-        _guard = _BlockCloseEsc(dialog)
-        dialog.installEventFilter(_guard)
+        dialog.keyPressEvent = _key_press
 
         vbox = QtWidgets.QVBoxLayout(dialog)
         label = QtWidgets.QLabel()
@@ -183,13 +258,32 @@ def show_license_failure_dialog(app: QtWidgets.QApplication) -> None:
         label.setText(msg_html)
         vbox.addWidget(label)
 
+        if qr_path is not None:
+            pixmap = QtGui.QPixmap(str(qr_path))
+            if not pixmap.isNull():
+                # 与原先 max-width:160px 一致：仅在过宽时缩小
+                if pixmap.width() > 160:
+                    pixmap = pixmap.scaledToWidth(160, QtCore.Qt.SmoothTransformation)
+                qr_label = QtWidgets.QLabel()
+                qr_label.setPixmap(pixmap)
+                qr_label.setAlignment(QtCore.Qt.AlignCenter)
+                qr_label.setContentsMargins(8, 8, 8, 8)
+                vbox.addWidget(qr_label)
+
+        footer = QtWidgets.QLabel()
+        footer.setTextFormat(QtCore.Qt.TextFormat.RichText)
+        footer.setWordWrap(True)
+        footer.setText(footer_html)
+        vbox.addWidget(footer)
+
         copy_btn = QtWidgets.QPushButton("生成【专属口令】")
         vbox.addWidget(copy_btn)
 
         def _on_copy_clicked() -> None:
+            nonlocal hwid_future
             copy_btn.setEnabled(False)
             try:
-                fp = machine_code.get_stable_hardware_id()
+                fp = hwid_future.result()
                 if not fp:
                     QtWidgets.QMessageBox(
                         QtWidgets.QMessageBox.Critical,
@@ -202,10 +296,6 @@ def show_license_failure_dialog(app: QtWidgets.QApplication) -> None:
                     return
 
                 QtWidgets.QApplication.clipboard().setText(fp)
-                try:
-                    QtWidgets.QApplication.restoreOverrideCursor()
-                except Exception:
-                    pass
                 info_box = QtWidgets.QMessageBox(
                     QtWidgets.QMessageBox.Information,
                     "已复制",
@@ -217,10 +307,6 @@ def show_license_failure_dialog(app: QtWidgets.QApplication) -> None:
                 info_box.exec()
                 dialog.accept()
             except Exception as e:
-                try:
-                    QtWidgets.QApplication.restoreOverrideCursor()
-                except Exception:
-                    pass
                 warn_box = QtWidgets.QMessageBox(
                     QtWidgets.QMessageBox.Warning,
                     "生成失败",
@@ -229,18 +315,17 @@ def show_license_failure_dialog(app: QtWidgets.QApplication) -> None:
                     dialog,
                 )
                 warn_box.exec()
+                # 失败的 Future 会重复抛出同一异常；重新提交计算，使下次点击真正重试
+                # （_cached_hwid 不缓存异常）
+                hwid_future = executor.submit(_hwid_in_worker)
                 copy_btn.setEnabled(True)
 
         copy_btn.clicked.connect(_on_copy_clicked)
         dialog.exec()
-        try:
-            QtWidgets.QApplication.restoreOverrideCursor()
-        except Exception:
-            pass
     except Exception:
         # 控制台回退
         try:
-            fp = machine_code.get_stable_hardware_id()
+            fp = hwid_future.result()
             if not fp:
                 print("[授权失败] 未找到 license.dat。")
                 app.quit()
@@ -248,6 +333,7 @@ def show_license_failure_dialog(app: QtWidgets.QApplication) -> None:
             print(f"[授权失败] 未找到 license.dat。机器指纹：{fp}")
         except Exception:
             print("[授权失败] 未找到 license.dat。")
+    executor.shutdown(wait=False)
     try:
         app.quit()
     except Exception:
@@ -257,5 +343,6 @@ def show_license_failure_dialog(app: QtWidgets.QApplication) -> None:
 __all__ = [
     "default_license_path",
     "license_is_ok",
+    "warm_license_caches",
     "show_license_failure_dialog",
 ]
\ No newline at end of file
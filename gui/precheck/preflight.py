@@ -8,6 +8,7 @@ previously defined in main_gui.py. It provides:
 - default_license_path/license_is_ok: License file path inference and check
 - show_no_nvidia_dialog/show_license_failure_dialog: User prompts
 - run_preflight_checks: Orchestrate the above checks
+- start_preflight_prefetch: Warm non-critical checks in the background
 
 All functions include docstrings and are designed to work in both
 development and PyInstaller-frozen runtime.
@@ -16,35 +17,135 @@ development and PyInstaller-frozen runtime.
 from __future__ import annotations
 
 import sys
-from pathlib import Path
-# typing.Optional 未使用，移除以保持导入整洁
+from concurrent.futures import Future, ThreadPoolExecutor, TimeoutError as FutureTimeoutError
+from typing import TYPE_CHECKING, Optional
 
-from PySide6 import QtWidgets
+if TYPE_CHECKING:
+    from PySide6 import QtWidgets
+
+from .runtime_paths import runtime_base_dir, resource_path, IS_FROZEN, PROJECT_ROOT
 
 # Ensure imports work both in development and PyInstaller-frozen runtime.
 # In frozen mode, bundled packages are available without modifying sys.path.
 # In development mode, add project root so `crypto_tool` can be imported.
-PROJECT_ROOT = Path(__file__).resolve().parents[2]
-if not getattr(sys, "frozen", False):
+if not IS_FROZEN:
     if str(PROJECT_ROOT) not in sys.path:
         sys.path.insert(0, str(PROJECT_ROOT))
 
+from .ffmpeg_paths import allow_system_fallback_env, nvenc_encode_works, resolve_ffmpeg_paths
 from .gpu_detect import detect_nvidia_gpu, show_no_nvidia_dialog
 from .license_check import (
     default_license_path,
     license_is_ok,
     show_license_failure_dialog,
+    warm_license_caches,
 )
-from .runtime_paths import runtime_base_dir, resource_path
+from .preflight_cache import load_gpu_result, save_gpu_result
+
+# 是否强制要求 NVIDIA 显卡。当前版本不做硬性要求，仅执行授权校验。
+REQUIRE_NVIDIA_GPU = False
+
+# 等待 GPU 检测结果的上限（秒）；驱动异常时 nvidia-smi 可能卡住很久
+GPU_PROBE_TIMEOUT_S = 2.0
+
+# 启动时预取的 GPU 检测结果（见 start_preflight_prefetch），供各 Tab 的预检复用
+_gpu_prefetch: Optional[Future] = None
+_prefetch_started = False
+
+
+def _safe_check(check) -> bool:
+    """Run a boolean check, mapping any exception to False.
+
+    Used as the task body for both preflight checks so that an exception
+    raised on the worker thread never propagates through ``Future.result``.
+    """
+    try:
+        return bool(check())
+    except Exception:
+        return False
+
+
+def _detect_gpu_for_preflight() -> bool:
+    """Return whether an NVIDIA GPU is present, preferring the NVENC probe.
+
+    When ffmpeg can be resolved, a one-frame NVENC test encode
+    (``nvenc_encode_works``) runs first: a successful encode proves an
+    NVIDIA GPU is present (and records that proof), so the separate
+    ``nvidia-smi`` probe is skipped. The encoder list alone is not used,
+    because ffmpeg builds list NVENC without a GPU. Otherwise falls back to
+    ``detect_nvidia_gpu``.
+
+    The result is persisted via ``preflight_cache`` and reused on later
+    launches while fresh and the ffmpeg binary is unchanged, skipping all
+    probe subprocesses. A cache hit only answers this preflight; it is not
+    recorded as GPU proof for ``detect_nvidia_gpu``.
+    """
+    ffmpeg_path = None
+    try:
+        ffmpeg_path = resolve_ffmpeg_paths(allow_system_fallback=allow_system_fallback_env(), modify_env=False).ffmpeg_path
+    except Exception:
+        pass
+
+    # 缓存命中只用于本次预检，不登记为 GPU 证据，避免缓存结果影响后续 detect_nvidia_gpu
+    cached = load_gpu_result(ffmpeg_path)
+    if cached is not None:
+        return cached
+
+    nvenc_ok = False
+    try:
+        nvenc_ok = nvenc_encode_works(ffmpeg_path)
+    except Exception:
+        pass
+    has_nv = nvenc_ok or detect_nvidia_gpu()
+    save_gpu_result(ffmpeg_path, has_nv, nvenc_ok)
+    return has_nv
+
+
+def start_preflight_prefetch() -> None:
+    """Start non-critical preflight work on background threads.
+
+    Call right after the main window is shown: the window renders
+    immediately while, in the background,
+    - the license path and QR resource caches are populated
+      (``warm_license_caches``), so a failure dialog opens without disk
+      scans;
+    - the GPU probe runs (only when ``REQUIRE_NVIDIA_GPU``).
+      ``run_preflight_checks`` later reuses the pending/finished result
+      instead of probing again.
+    The license check itself is never prefetched; it must be evaluated on
+    each preflight.
+
+    Idempotent: subsequent calls are no-ops.
+    """
+    global _gpu_prefetch, _prefetch_started
+    if _prefetch_started:
+        return
+    _prefetch_started = True
+    executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix="preflight")
+    executor.submit(warm_license_caches)
+    if REQUIRE_NVIDIA_GPU:
+        _gpu_prefetch = executor.submit(_safe_check, _detect_gpu_for_preflight)
+    # 已提交的任务仍会执行完毕，这里只是不再接收新任务
+    executor.shutdown(wait=False)
+
 
 def _run_preflight_checks(app: QtWidgets.QApplication) -> bool:
     """Run startup preflight checks: GPU requirement and license check.
 
     This function orchestrates two independent checks and their UI prompts:
-    1) NVIDIA GPU presence. If missing, show a blocking dialog and quit.
+    1) NVIDIA GPU presence (only when ``REQUIRE_NVIDIA_GPU`` is enabled).
+       If missing, show a blocking dialog and quit.
     2) License/authorization check. If it fails, show a dialog with a
        "copy machine fingerprint" helper and quit.
 
+    The GPU probe spawns subprocesses (ffmpeg, nvidia-smi etc.) while the license
+    check is disk/crypto bound, so the GPU probe runs on a worker thread
+    (reusing the startup prefetch when available) while the license is
+    verified on the calling thread. Dialogs are always shown on the calling
+    thread, GPU first, to keep the prompt order stable. The wait for the
+    GPU result is bounded by ``GPU_PROBE_TIMEOUT_S``; on timeout the result
+    is treated as unknown and the check fails open.
+
     Parameters
     ----------
     app : QtWidgets.QApplication
@@ -55,20 +156,27 @@ def _run_preflight_checks(app: QtWidgets.QApplication) -> bool:
     bool
         True to continue launching; False to terminate the app.
     """
-    # # 1) NVIDIA GPU check
-    # try:
-    #     has_nv = detect_nvidia_gpu()
-    # except Exception:
-    #     has_nv = False
-    # if not has_nv:
-    #     show_no_nvidia_dialog(app)
-    #     return False
+    # 未预取时在此启动；已预取则直接复用其结果
+    start_preflight_prefetch()
+    gpu_future = _gpu_prefetch
+
+    # License/authorization check (overlaps with the GPU probe)
+    lic_ok = _safe_check(license_is_ok)
+
+    # 1) NVIDIA GPU check
+    if gpu_future is not None:
+        try:
+            has_nv = gpu_future.result(timeout=GPU_PROBE_TIMEOUT_S)
+        except FutureTimeoutError:
+            # 超时视为未知，放行（不阻塞启动）。PCI 扫描未发现 NVIDIA 设备只是提示
+            # （WSL2/虚拟机中显卡可能不以 PCI 设备出现），不能据此判定无显卡
+            has_nv = True
+            print(f"[启动检查] GPU 检测超过 {GPU_PROBE_TIMEOUT_S:g}s 未返回，视为未知并放行")
+        if not has_nv:
+            show_no_nvidia_dialog(app)
+            return False
 
     # 2) License/authorization check
-    try:
-        lic_ok = license_is_ok()
-    except Exception:
-        lic_ok = False
     if not lic_ok:
         show_license_failure_dialog(app)
         return False
@@ -83,6 +191,8 @@ def run_preflight_checks(app=None) -> bool:
     """
     try:
         if app is None:
+            from PySide6 import QtWidgets
+
             app = QtWidgets.QApplication.instance()
         if app is None:
             return False
@@ -93,6 +203,7 @@ def run_preflight_checks(app=None) -> bool:
 
 __all__ = [
     "detect_nvidia_gpu",
+    "start_preflight_prefetch",
     "runtime_base_dir",
     "resource_path",
     "default_license_path",
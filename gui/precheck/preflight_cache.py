@@ -0,0 +1,151 @@
+"""Persistent cache for preflight probe results.
+
+The GPU probe spawns subprocesses (ffmpeg -encoders, nvidia-smi, ...), and
+its answer does not change between launches unless the ffmpeg binary or the
+hardware changes. This module stores the last result in a small JSON file
+under the per-user cache directory so a warm restart can skip the probes.
+
+Only hardware probe results are cached here; the license check is always
+evaluated fresh.
+
+Cache invalidation:
+- The entry expires after ``CACHE_TTL_SECONDS`` (24 h).
+- The entry is ignored when the ffmpeg path, size or mtime differs.
+- Setting ``PREFLIGHT_RECHECK=1`` ignores and removes the cache file.
+- Entries written with an older ``_CACHE_SCHEMA`` are ignored.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import sys
+import time
+from pathlib import Path
+from typing import Optional
+
+# 缓存有效期（秒）
+CACHE_TTL_SECONDS = 24 * 3600
+
+_APP_DIR_NAME = "replace_video_bgm"
+_CACHE_FILE_NAME = "preflight.json"
+# 缓存格式版本：早期版本可能把 ffmpeg 编码器列表（并非硬件证据）的结果写入缓存，升级版本使其失效
+_CACHE_SCHEMA = 2
+
+
+def cache_file_path() -> Path:
+    """Return the per-user preflight cache file path.
+
+    - Windows: ``%LOCALAPPDATA%`` (or ``%APPDATA%``)
+    - Other: ``$XDG_CACHE_HOME`` or ``~/.cache``
+    """
+    if sys.platform.startswith("win"):
+        base = os.environ.get("LOCALAPPDATA") or os.environ.get("APPDATA") or str(Path.home())
+    else:
+        base = os.environ.get("XDG_CACHE_HOME") or str(Path.home() / ".cache")
+    return Path(base) / _APP_DIR_NAME / _CACHE_FILE_NAME
+
+
+def recheck_requested() -> bool:
+    """Return True when env var PREFLIGHT_RECHECK asks to bypass the cache.
+
+    Accepts '1', 'true', 'yes', 'on' (case-insensitive), like
+    ``FFMPEG_DEV_FALLBACK``.
+    """
+    return os.getenv("PREFLIGHT_RECHECK", "").strip().lower() in ("1", "true", "yes", "on")
+
+
+def _ffmpeg_fingerprint(ffmpeg_path: Optional[str]) -> Optional[list]:
+    """Return [path, size, mtime_ns] for ffmpeg, or None if unavailable."""
+    if not ffmpeg_path:
+        return None
+    try:
+        st = os.stat(ffmpeg_path)
+    except OSError:
+        return None
+    return [str(ffmpeg_path), int(st.st_size), int(st.st_mtime_ns)]
+
+
+def clear_preflight_cache() -> None:
+    """Remove the cache file if present."""
+    try:
+        cache_file_path().unlink()
+    except OSError:
+        pass
+
+
+def load_gpu_result(ffmpeg_path: Optional[str]) -> Optional[bool]:
+    """Return the cached NVIDIA GPU result, or None on miss.
+
+    Parameters
+    ----------
+    ffmpeg_path : Optional[str]
+        Currently resolved ffmpeg; must match the fingerprint stored with
+        the cached result.
+
+    Returns
+    -------
+    Optional[bool]
+        Cached ``gpu_nvidia`` value when the entry is fresh and matches,
+        otherwise None.
+    """
+    if recheck_requested():
+        clear_preflight_cache()
+        return None
+    try:
+        with open(cache_file_path(), "r", encoding="utf-8") as f:
+            data = json.load(f)
+        if data.get("schema") != _CACHE_SCHEMA:
+            return None
+        checked_at = float(data.get("checked_at", 0))
+        if not (0 <= time.time() - checked_at < CACHE_TTL_SECONDS):
+            return None
+        if data.get("ffmpeg") != _ffmpeg_fingerprint(ffmpeg_path):
+            return None
+        value = data.get("gpu_nvidia")
+        return value if isinstance(value, bool) else None
+    except Exception:
+        return None
+
+
+def save_gpu_result(ffmpeg_path: Optional[str], gpu_nvidia: bool, nvenc: bool) -> None:
+    """Persist the GPU probe result; write failures are ignored.
+
+    Only pass results of real hardware probes (``nvidia-smi``/PCI/NVENC
+    test encode), never inferences from ffmpeg's encoder list.
+
+    Parameters
+    ----------
+    ffmpeg_path : Optional[str]
+        ffmpeg used for the NVENC probe (fingerprinted for invalidation).
+    gpu_nvidia : bool
+        Whether an NVIDIA GPU was detected.
+    nvenc : bool
+        Whether ffmpeg reported NVENC encoders.
+    """
+    payload = {
+        "schema": _CACHE_SCHEMA,
+        "gpu_nvidia": bool(gpu_nvidia),
+        "nvenc": bool(nvenc),
+        "ffmpeg": _ffmpeg_fingerprint(ffmpeg_path),
+        "checked_at": time.time(),
+    }
+    try:
+        path = cache_file_path()
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_suffix(".tmp")
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump(payload, f, ensure_ascii=False)
+        os.replace(tmp, path)
+    except Exception:
+        pass
+
+
+__all__ = [
+    "CACHE_TTL_SECONDS",
+    "cache_file_path",
+    "recheck_requested",
+    "clear_preflight_cache",
+    "load_gpu_result",
+    "save_gpu_result",
+]
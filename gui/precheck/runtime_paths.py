@@ -15,6 +15,12 @@ from pathlib import Path
 # Project root directory (repository root), used when not frozen.
 PROJECT_ROOT = Path(__file__).resolve().parents[2]
 
+# Whether running from a PyInstaller bundle; decided at process start.
+IS_FROZEN = bool(getattr(sys, "frozen", False))
+
+# PyInstaller extraction directory, or None when not frozen/unavailable.
+_MEIPASS_DIR = Path(getattr(sys, "_MEIPASS")).resolve() if IS_FROZEN and hasattr(sys, "_MEIPASS") else None
+
 
 def runtime_base_dir() -> Path:
     """Return base directory for resource lookup depending on runtime.
@@ -22,17 +28,15 @@ def runtime_base_dir() -> Path:
     - Frozen (PyInstaller onefile/onedir): use sys._MEIPASS as base.
     - Development (non-frozen): use project root (PROJECT_ROOT).
 
+    The runtime mode cannot change within a process, so both candidates
+    are computed once at import.
+
     Returns
     -------
     Path
         The directory from which bundled resources should be read.
     """
-    try:
-        if getattr(sys, "frozen", False) and hasattr(sys, "_MEIPASS"):
-            return Path(getattr(sys, "_MEIPASS")).resolve()
-    except Exception:
-        pass
-    return PROJECT_ROOT
+    return _MEIPASS_DIR or PROJECT_ROOT
 
 
 def resource_path(*parts: str) -> Path:
@@ -52,4 +56,4 @@ def resource_path(*parts: str) -> Path:
     return runtime_base_dir().joinpath(*parts)
 
 
-__all__ = ["runtime_base_dir", "resource_path", "PROJECT_ROOT"]
\ No newline at end of file
+__all__ = ["runtime_base_dir", "resource_path", "PROJECT_ROOT", "IS_FROZEN"]
\ No newline at end of file
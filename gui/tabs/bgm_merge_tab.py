@@ -12,8 +12,12 @@ Design goals
 
 from __future__ import annotations
 
+from pathlib import Path
 from typing import Optional
-from PySide6 import QtWidgets
+from PySide6 import QtCore, QtGui, QtWidgets
+
+# 文档路径（相对本模块上一级目录），模块加载时计算一次
+_README_PATH = Path(__file__).resolve().parents[1] / "README_v3.md"
 
 
 class BgmMergeTab(QtWidgets.QWidget):
@@ -63,19 +67,16 @@ class BgmMergeTab(QtWidgets.QWidget):
 
     def _open_readme_v3(self) -> None:
         """
-        Open README_v3.md in the system's default file manager.
+        Open README_v3.md with the system's default application.
+
+        Uses QDesktopServices (ShellExecute on Windows) instead of spawning
+        an explorer/open process.
         """
-        import os
-        import subprocess
-        from utils.common_utils import get_subprocess_silent_kwargs
         try:
-            base = os.path.dirname(os.path.dirname(__file__))
-            readme_path = os.path.join(base, "README_v3.md")
-            if os.path.exists(readme_path):
-                if os.name == "nt":
-                    subprocess.Popen(["explorer", readme_path], **get_subprocess_silent_kwargs())
-                else:
-                    subprocess.Popen(["open", readme_path])
+            readme_path = str(_README_PATH)
+            if _README_PATH.is_file():
+                if not QtGui.QDesktopServices.openUrl(QtCore.QUrl.fromLocalFile(readme_path)):
+                    QtWidgets.QMessageBox.warning(self, "错误", f"打开文档失败：{readme_path}")
             else:
                 QtWidgets.QMessageBox.information(self, "提示", f"未找到文档：{readme_path}")
         except Exception as e:
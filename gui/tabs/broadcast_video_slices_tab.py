@@ -11,20 +11,24 @@
   2) group2（切片参数）
      - 场景模式：下拉选择（ecommerce/game/entertainment）
      - 模型目录：QLineEdit + 浏览（仅目录；不能为空）
+     - 设备 / 精度：Whisper 运行设备（auto/cuda/cpu）与推理精度（默认 int8_float16）
      - 问号提示：从链接下载模型文件到本地（Florence-2 与 faster-whisper）
 
 - 右侧面板：
   - 顶部进度条 + 开始/停止按钮（互斥状态）
-  - 下方结果表（文件输出路径、时长、文件大小），支持双击打开文件
+  - 下方结果表（文件输出路径、时长、文件大小；QTableView + 模型，表头可按数值排序），支持双击打开文件
 
 运行逻辑：
-- 不使用并发，在后台线程顺序处理视频。
+- 在后台线程中按"并发数"并行处理多个视频（默认 1，即顺序处理），共享同一个切片器实例。
 - 直接调用 video_tool.broadcast_video_slices.BroadcastVideoSlices，参数按 CLI 默认值传入。
 """
 
 from __future__ import annotations
 
-from typing import Optional, List, Tuple
+from collections import deque
+from concurrent.futures import CancelledError, Future, ThreadPoolExecutor, as_completed
+import functools
+from typing import Any, Dict, Iterable, Iterator, Optional, List, Tuple
 import os
 from PySide6 import QtWidgets, QtCore, QtGui
 
@@ -34,6 +38,76 @@ from video_tool.broadcast_video_slices import BroadcastVideoSlices
 from utils.calcu_video_info import ffprobe_duration
 
 
+# 支持的视频扩展名（小写，含点），模块级常量避免逐文件构造元组
+_VIDEO_EXTS = frozenset({".mp4", ".avi", ".mov", ".mkv"})
+
+
+def _iter_videos(paths: Iterable[str]) -> Iterator[str]:
+    """逐个产出输入路径中的视频文件（目录只扫描一层，不递归）。
+
+    目录使用 os.scandir 遍历，DirEntry 自带文件类型信息，无需对每个条目再做 stat；
+    无法访问的路径被跳过。
+    """
+    for d in paths:
+        if not d:
+            continue
+        try:
+            if os.path.isdir(d):
+                with os.scandir(d) as it:
+                    for e in it:
+                        if os.path.splitext(e.name)[1].lower() in _VIDEO_EXTS and e.is_file():
+                            yield e.path
+            elif os.path.isfile(d) and os.path.splitext(d)[1].lower() in _VIDEO_EXTS:
+                yield d
+        except OSError:
+            continue
+
+
+def _scan_file_sizes(dirs: Iterable[str]) -> Dict[str, int]:
+    """用 os.scandir 一次性读取目录中文件大小，返回 {文件路径: 字节数}。
+
+    Windows 上 DirEntry.stat() 直接使用目录枚举时带回的信息，无需逐个文件再 stat。
+    """
+    sizes: Dict[str, int] = {}
+    for d in dirs:
+        try:
+            with os.scandir(d) as it:
+                for e in it:
+                    if e.is_file():
+                        sizes[os.path.normcase(e.path)] = int(e.stat().st_size)
+        except OSError:
+            continue
+    return sizes
+
+
+def _probe_output(path: str, known_dur: Optional[float] = None, known_size: Optional[int] = None) -> Tuple[str, float, int]:
+    """返回 (路径, 时长, 文件大小)；已知的字段不再探测，探测失败的字段置 0。"""
+    if known_dur is not None:
+        dur = float(known_dur)
+    else:
+        try:
+            dur = float(ffprobe_duration(path) or 0.0)
+        except Exception:
+            dur = 0.0
+    if known_size is not None:
+        size = int(known_size)
+    else:
+        try:
+            size = int(os.path.getsize(path))
+        except Exception:
+            size = 0
+    return path, dur, size
+
+
+@functools.lru_cache(maxsize=1)
+def _probe_executor() -> ThreadPoolExecutor:
+    """返回进程内共享的输出探测线程池（首次调用时创建，跨运行常驻）。
+
+    视频切片线程只提交探测任务、不等待结果，可立即处理下一个视频。
+    """
+    return ThreadPoolExecutor(max_workers=min(16, 2 * (os.cpu_count() or 1)), thread_name_prefix="slice-probe")
+
+
 def _open_in_os(path: str) -> None:
     """在操作系统中打开指定路径。"""
     try:
@@ -46,26 +120,78 @@ def _open_in_os(path: str) -> None:
 
 
 class BroadcastVideoSlicesWorker(QtCore.QObject):
-    """后台顺序执行直播切片任务的工作器。"""
+    """后台执行直播切片任务的工作器（视频级并发，数量由 workers 指定）。"""
 
     phase = QtCore.Signal(str)
     progress = QtCore.Signal(int, int)
     row_added = QtCore.Signal(str, float, int)
-    finished = QtCore.Signal(int)
+    # (完成的视频数, 单个视频失败信息列表)；单个视频失败不会中断整批任务
+    finished = QtCore.Signal(int, list)
+    # 整批任务无法继续的致命错误
     error = QtCore.Signal(str)
-    start = QtCore.Signal(list, str, str, str, bool, bool, str, int)
+    start = QtCore.Signal(list, str, str, str, bool, bool, str, int, int, str, str)
 
-    def __init__(self) -> None:
+    def __init__(
+        self,
+        slicer_cache: Optional[Dict[str, BroadcastVideoSlices]] = None,
+        preflight_ok: bool = False,
+    ) -> None:
+        """初始化工作器。
+
+        参数
+        ----
+        slicer_cache: 由标签页持有的切片器缓存（键为模型目录绝对路径），跨多次运行复用
+        preflight_ok: 本会话内预检是否已通过；为 True 时跳过预检
+        """
         super().__init__()
         self._stopping: bool = False
+        self._slicer_cache: Dict[str, BroadcastVideoSlices] = slicer_cache if slicer_cache is not None else {}
+        self.preflight_ok: bool = bool(preflight_ok)
+        # 当前运行已提交的视频任务；停止时立即取消其中尚未开始的任务
+        self._futures: List[Future] = []
 
     def stop(self) -> None:
-        """发起软停止请求。"""
+        """发起软停止请求，并取消尚未开始的视频任务。"""
         self._stopping = True
-
-    @QtCore.Slot(list, str, str, str, bool, bool, str, int)
-    def run(self, video_dirs: List[str], output_root: str, models_root: str, mode: str, add_subtitles: bool, translate: bool, language: str, max_chars_per_line: int) -> None:
-        """顺序执行切片任务。
+        for f in list(self._futures):
+            f.cancel()
+
+    def _process_one(
+        self,
+        slicer: BroadcastVideoSlices,
+        vp: str,
+        output_root: str,
+        mode: str,
+        kwargs: Dict[str, Any],
+    ) -> Optional[List[Future[Tuple[str, float, int]]]]:
+        """切片单个视频，返回各输出的探测任务（结果为 (输出路径, 时长, 文件大小)）。在线程池中执行。
+
+        已请求停止时不处理该视频并返回 None，调用方据此不计入完成数。
+        """
+        if self._stopping:
+            return None
+        # 未指定输出根目录时传 None，由 cut_video 采用视频同名目录；目录创建统一由 cut_video 完成
+        out_dir: Optional[str] = None
+        if output_root:
+            out_dir = os.path.join(output_root, os.path.splitext(os.path.basename(vp))[0])
+
+        # cut_video 回填已知的片段时长，只有缺失的才需要 ffprobe
+        durations: Dict[str, float] = {}
+        outs = slicer.cut_video(video_path=vp, output_dir=out_dir, mode=mode, durations=durations, **kwargs)
+        if not outs:
+            return []
+        # 输出目录各扫描一次取得文件大小，代替逐个 getsize
+        sizes = _scan_file_sizes({os.path.dirname(outp) for outp in outs})
+        # 其余探测（缺失时长的 ffprobe、未扫描到的文件大小）交给共享线程池，本线程不等待结果
+        pool = _probe_executor()
+        return [
+            pool.submit(_probe_output, outp, durations.get(outp), sizes.get(os.path.normcase(outp)))
+            for outp in outs
+        ]
+
+    @QtCore.Slot(list, str, str, str, bool, bool, str, int, int, str, str)
+    def run(self, video_dirs: List[str], output_root: str, models_root: str, mode: str, add_subtitles: bool, translate: bool, language: str, max_chars_per_line: int, workers: int, device: str, compute_type: str) -> None:
+        """执行切片任务，最多 workers 个视频并行。
 
         参数
         ----
@@ -73,84 +199,155 @@ class BroadcastVideoSlicesWorker(QtCore.QObject):
         output_root: 输出根目录（为空则每视频同名目录在原位置）
         models_root: 模型基础目录（包含 faster_wishper 与 florence2 子目录）
         mode: 切片场景模式：ecommerce/game/entertainment
+        workers: 并发处理的视频数；为 1 时与顺序处理一致
+        device: 模型运行设备：auto/cuda/cpu
+        compute_type: Whisper 推理精度（cpu 上含 float16 的精度回退为 int8）
         """
         try:
-            app = QtWidgets.QApplication.instance()
-            ok = bool(run_preflight_checks(app)) if app is not None else False
-            if not ok:
-                try:
-                    QtWidgets.QMessageBox.warning(self, "未授权或环境不满足", "未授权或环境不满足，无法开始")
-                except Exception:
-                    pass
-                return
+            if not self.preflight_ok:
+                app = QtWidgets.QApplication.instance()
+                ok = bool(run_preflight_checks(app)) if app is not None else False
+                if not ok:
+                    try:
+                        QtWidgets.QMessageBox.warning(self, "未授权或环境不满足", "未授权或环境不满足，无法开始")
+                    except Exception:
+                        pass
+                    return
+                self.preflight_ok = True
     
-            # 统计所有视频文件
-            videos: List[str] = []
-            for d in video_dirs:
-                try:
-                    if not d:
-                        continue
-                    if os.path.isdir(d):
-                        for f in os.listdir(d):
-                            if f.lower().endswith((".mp4", ".avi", ".mov", ".mkv")):
-                                videos.append(os.path.join(d, f))
-                    elif os.path.isfile(d) and d.lower().endswith((".mp4", ".avi", ".mov", ".mkv")):
-                        videos.append(d)
-                except Exception:
-                    continue
+            # 统计所有视频文件（单次 scandir 扫描；进度条需要总数，路径列表本身很小）
+            videos: List[str] = list(_iter_videos(video_dirs))
 
             total = len(videos)
             self.progress.emit(0, total)
             done = 0
-
-            # 实例化切片器
-            slicer = BroadcastVideoSlices(model_size="large-v3", device="auto", models_root=models_root)
-
-            for vp in videos:
-                if self._stopping:
-                    break
+            failures: List[str] = []
+
+            # 切片器按 模型目录|设备|精度 缓存在标签页上：各并发任务共享，多次运行间复用，模型只加载一次
+            cache_key = f"{os.path.abspath(models_root)}|{device}|{compute_type}"
+            slicer = self._slicer_cache.get(cache_key)
+            if slicer is None:
+                slicer = BroadcastVideoSlices(
+                    model_size="large-v3",
+                    device=device or "auto",
+                    models_root=models_root,
+                    compute_type=compute_type or None,
+                )
+                self._slicer_cache[cache_key] = slicer
+
+            kwargs = {
+                "language": language,
+                "use_nvenc": False,
+                "crf": 23,
+                "add_subtitles": bool(add_subtitles),
+                "translate": bool(translate),
+                "max_chars_per_line": int(max_chars_per_line),
+                "vision_verify": True,
+            }
+            # 输出根目录整批只创建一次，各视频子目录由 cut_video 创建
+            if output_root:
                 try:
-                    base = os.path.splitext(os.path.basename(vp))[0]
-                    if output_root:
-                        out_dir = os.path.join(output_root, base)
-                    else:
-                        out_dir = os.path.join(os.path.dirname(os.path.abspath(vp)), base)
+                    os.makedirs(output_root, exist_ok=True)
+                except Exception:
+                    pass
+            max_workers = max(1, min(int(workers), total or 1))
+            with ThreadPoolExecutor(max_workers=max_workers) as ex:
+                future_to_video = {ex.submit(self._process_one, slicer, vp, output_root, mode, kwargs): vp for vp in videos}
+                futures = list(future_to_video)
+                self._futures = futures
+                # 提交期间已请求停止时，stop() 看不到这批任务，在此补充取消
+                if self._stopping:
+                    for f in futures:
+                        f.cancel()
+                for fut in as_completed(futures):
                     try:
-                        os.makedirs(out_dir, exist_ok=True)
-                    except Exception:
-                        pass
-
-                    kwargs = {
-                        "language": language,
-                        "use_nvenc": False,
-                        "crf": 23,
-                        "add_subtitles": bool(add_subtitles),
-                        "translate": bool(translate),
-                        "max_chars_per_line": int(max_chars_per_line),
-                        "vision_verify": True,
-                    }
-                    outs = slicer.cut_video(video_path=vp, output_dir=out_dir, mode=mode, **kwargs)
-                    for outp in outs:
-                        try:
-                            dur = float(ffprobe_duration(outp) or 0.0)
-                        except Exception:
-                            dur = 0.0
-                        try:
-                            size = int(os.path.getsize(outp))
-                        except Exception:
-                            size = 0
-                        self.row_added.emit(outp, dur, size)
-                except Exception as e:
-                    self.error.emit(f"处理失败: {e}")
-                finally:
+                        probes = fut.result()
+                        if probes is None:
+                            # 停止后才开始执行、未实际处理的视频不计入完成数
+                            continue
+                        for probe in probes:
+                            self.row_added.emit(*probe.result())
+                    except CancelledError:
+                        # 停止后被取消的排队任务不计入完成数
+                        continue
+                    except Exception as e:
+                        # 单个视频失败只记录，其余视频继续处理，结束时随 finished 一并汇报
+                        failures.append(f"{os.path.basename(future_to_video[fut])}: {e}")
                     done += 1
                     self.progress.emit(done, total)
+            self._futures = []
 
-            self.finished.emit(done)
+            self.finished.emit(done, failures)
         except Exception as e:
             self.error.emit(str(e))
 
 
+class SliceResultModel(QtCore.QAbstractTableModel):
+    """切片结果表模型：保存原始数值，显示文本在 data() 中按需格式化。
+
+    DisplayRole 返回格式化文本；UserRole 返回原始值（路径/秒/字节），用于数值排序。
+    """
+
+    HEADERS = ("文件输出路径", "时长(秒)", "文件大小(MB)")
+
+    def __init__(self, parent: Optional[QtCore.QObject] = None) -> None:
+        super().__init__(parent)
+        self._rows: List[Tuple[str, float, int]] = []
+
+    def rowCount(self, parent: QtCore.QModelIndex = QtCore.QModelIndex()) -> int:  # type: ignore[override]
+        return 0 if parent.isValid() else len(self._rows)
+
+    def columnCount(self, parent: QtCore.QModelIndex = QtCore.QModelIndex()) -> int:  # type: ignore[override]
+        return 0 if parent.isValid() else len(self.HEADERS)
+
+    def data(self, index: QtCore.QModelIndex, role: int = QtCore.Qt.DisplayRole) -> Any:  # type: ignore[override]
+        if not index.isValid():
+            return None
+        row = self._rows[index.row()]
+        col = index.column()
+        if role == QtCore.Qt.DisplayRole:
+            if col == 0:
+                return row[0]
+            if col == 1:
+                return f"{row[1]:.2f}"
+            return f"{(row[2] / (1024.0 * 1024.0)) if row[2] > 0 else 0.0:.2f}"
+        if role == QtCore.Qt.UserRole:
+            return row[col]
+        return None
+
+    def headerData(self, section: int, orientation: QtCore.Qt.Orientation, role: int = QtCore.Qt.DisplayRole) -> Any:  # type: ignore[override]
+        if role == QtCore.Qt.DisplayRole and orientation == QtCore.Qt.Horizontal:
+            return self.HEADERS[section]
+        return super().headerData(section, orientation, role)
+
+    def sort(self, column: int, order: QtCore.Qt.SortOrder = QtCore.Qt.AscendingOrder) -> None:  # type: ignore[override]
+        """按原始值排序（时长/大小为数值排序）；column < 0 表示不排序。"""
+        if column < 0 or column >= len(self.HEADERS):
+            return
+        self.layoutAboutToBeChanged.emit()
+        self._rows.sort(key=lambda r: r[column], reverse=(order == QtCore.Qt.DescendingOrder))
+        self.layoutChanged.emit()
+
+    def append_rows(self, rows: List[Tuple[str, float, int]]) -> None:
+        """在末尾批量追加结果行（一次 beginInsertRows/endInsertRows）。"""
+        if not rows:
+            return
+        start = len(self._rows)
+        self.beginInsertRows(QtCore.QModelIndex(), start, start + len(rows) - 1)
+        self._rows.extend(rows)
+        self.endInsertRows()
+
+    def clear(self) -> None:
+        """清空全部结果。"""
+        self.beginResetModel()
+        self._rows.clear()
+        self.endResetModel()
+
+    def path_at(self, row: int) -> str:
+        """返回指定行的输出文件路径。"""
+        return self._rows[row][0]
+
+
 class BroadcastVideoSlicesTab(QtWidgets.QWidget):
     """“直播切片”标签页。"""
 
@@ -163,7 +360,26 @@ class BroadcastVideoSlicesTab(QtWidgets.QWidget):
         # 场景模式中英映射：显示中文，内部传英文键
         self.mode_label_to_key = {"电商": "ecommerce", "游戏": "game", "娱乐": "entertainment"}
         self.mode_key_to_label = {v: k for k, v in self.mode_label_to_key.items()}
+        # 结果行缓冲：突发到达的 row_added 先入队，由定时器合并为一次批量插入
+        self._pending_rows: deque[Tuple[str, float, int]] = deque()
+        self._row_flush_timer = QtCore.QTimer(self)
+        self._row_flush_timer.setSingleShot(True)
+        self._row_flush_timer.setInterval(50)
+        self._row_flush_timer.timeout.connect(self._flush_rows)
+        self._columns_sized: bool = False
+        # 跨运行复用：切片器（含已加载模型）按模型目录缓存；预检通过后本会话不再重复
+        self._slicer_cache: Dict[str, BroadcastVideoSlices] = {}
+        self._preflight_ok: bool = False
+        # 与 video_list 同步的路径集合，添加时 O(1) 去重
+        self._video_set: set[str] = set()
+        # 进度条上次设置的百分比
+        self._last_pct: int = 0
+        # DPI 相关尺寸只计算一次，屏幕 DPI 变化时再刷新
+        self._update_dpi_metrics()
         self._build_page()
+        screen = QtWidgets.QApplication.primaryScreen()
+        if screen is not None:
+            screen.logicalDotsPerInchChanged.connect(self._on_dpi_changed)
 
     def is_running(self) -> bool:
         """返回当前是否处于运行状态。"""
@@ -269,6 +485,20 @@ class BroadcastVideoSlicesTab(QtWidgets.QWidget):
         row_model.addWidget(help_btn)
         gl2.addLayout(row_model)
 
+        row_device = QtWidgets.QHBoxLayout()
+        row_device.addWidget(QtWidgets.QLabel("设备："), 0)
+        self.device_combo = QtWidgets.QComboBox()
+        self.device_combo.addItems(["auto", "cuda", "cpu"])
+        self.device_combo.setCurrentText("auto")
+        row_device.addWidget(self.device_combo, 1)
+        row_device.addWidget(QtWidgets.QLabel("精度："), 0)
+        self.compute_combo = QtWidgets.QComboBox()
+        self.compute_combo.addItems(["int8_float16", "float16", "int8"])
+        self.compute_combo.setCurrentText("int8_float16")
+        self.compute_combo.setToolTip("Whisper 推理精度：int8_float16 显存占用约为 float16 的一半；CPU 上自动使用 int8")
+        row_device.addWidget(self.compute_combo, 1)
+        gl2.addLayout(row_device)
+
         row_subs = QtWidgets.QHBoxLayout()
         self.add_subs_chk = QtWidgets.QCheckBox("叠加字幕")
         self.add_subs_chk.setChecked(True)
@@ -294,6 +524,16 @@ class BroadcastVideoSlicesTab(QtWidgets.QWidget):
         row_cpl.addWidget(self.cpl_spin, 1)
         gl2.addLayout(row_cpl)
 
+        # 并发数：同时处理的视频数（共享模型；显存有限时保持 1）
+        row_workers = QtWidgets.QHBoxLayout()
+        row_workers.addWidget(QtWidgets.QLabel("并发数："), 0)
+        self.workers_spin = QtWidgets.QSpinBox()
+        self.workers_spin.setRange(1, max(1, min(8, int(os.cpu_count() or 1))))
+        self.workers_spin.setValue(1)
+        self.workers_spin.setToolTip("同时处理的视频数量；各任务共享已加载的模型，显存不足时请保持为 1")
+        row_workers.addWidget(self.workers_spin, 1)
+        gl2.addLayout(row_workers)
+
         layout.addWidget(group1)
         layout.addWidget(group2)
         return container
@@ -323,73 +563,82 @@ class BroadcastVideoSlicesTab(QtWidgets.QWidget):
         gpl.addLayout(row)
         layout.addWidget(group_run)
 
-        self.table = QtWidgets.QTableWidget(0, 3)
-        self.table.setHorizontalHeaderLabels(["文件输出路径", "时长(秒)", "文件大小(MB)"])
+        self.result_model = SliceResultModel(self)
+        self.table = QtWidgets.QTableView()
+        self.table.setModel(self.result_model)
         self.table.horizontalHeader().setStretchLastSection(False)
         self.table.setEditTriggers(QtWidgets.QAbstractItemView.NoEditTriggers)
         self.table.setSelectionBehavior(QtWidgets.QAbstractItemView.SelectRows)
         self.table.setSelectionMode(QtWidgets.QAbstractItemView.SingleSelection)
-        self.table.cellDoubleClicked.connect(self._on_table_double_clicked)
+        # 点击表头按原始数值排序；初始不排序，保持结果到达顺序
+        self.table.horizontalHeader().setSortIndicator(-1, QtCore.Qt.AscendingOrder)
+        self.table.setSortingEnabled(True)
+        self.table.doubleClicked.connect(self._on_table_double_clicked)
         layout.addWidget(self.table, 1)
         return container
 
+    def _update_dpi_metrics(self) -> None:
+        """按主屏逻辑 DPI 计算并缓存缩放系数、控件高度与字号。"""
+        screen = QtWidgets.QApplication.primaryScreen()
+        dpi = screen.logicalDotsPerInch() if screen else 96.0
+        self._dpi_scale: float = max(1.0, dpi / 96.0)
+        self._control_height: int = int(max(28, min(52, 32 * self._dpi_scale)))
+        self._ctrl_font_pt: int = int(max(11, min(16, 11 * self._dpi_scale)))
+
+    def _on_dpi_changed(self, *_args: Any) -> None:
+        """主屏 DPI 变化时重新计算尺寸并刷新运行区控件样式。"""
+        self._update_dpi_metrics()
+        self._apply_progressbar_style(chunk_color=theme.PRIMARY_BLUE)
+        self._apply_action_button_style(self._is_running)
+
     def _apply_progressbar_style(self, chunk_color: str = theme.PRIMARY_BLUE) -> None:
-        """统一设置进度条样式与尺寸。"""
-        try:
-            self.progress_bar.setSizePolicy(QtWidgets.QSizePolicy.Expanding, QtWidgets.QSizePolicy.Fixed)
-            screen = QtWidgets.QApplication.primaryScreen()
-            dpi = screen.logicalDotsPerInch() if screen else 96.0
-            scale = max(1.0, dpi / 96.0)
-        except Exception:
-            scale = 1.0
-        base_h = 32
-        height = int(max(28, min(52, base_h * scale)))
-        try:
-            self.progress_bar.setFixedHeight(height)
-            self._control_height = height
-        except Exception:
-            self._control_height = getattr(self, "_control_height", theme.BUTTON_HEIGHT)
-        try:
-            font = self.progress_bar.font()
-            base_pt = 11
-            pt_size = int(max(base_pt, min(16, base_pt * scale)))
-            font.setPointSize(pt_size)
-            self.progress_bar.setFont(font)
-        except Exception:
-            pass
-        try:
-            style = theme.build_progressbar_stylesheet(height=height, chunk_color=chunk_color)
-            self.progress_bar.setStyleSheet(style)
-        except Exception:
-            pass
+        """统一设置进度条样式与尺寸（使用缓存的 DPI 尺寸）。"""
+        height = self._control_height
+        self.progress_bar.setSizePolicy(QtWidgets.QSizePolicy.Expanding, QtWidgets.QSizePolicy.Fixed)
+        self.progress_bar.setFixedHeight(height)
+        font = self.progress_bar.font()
+        font.setPointSize(self._ctrl_font_pt)
+        self.progress_bar.setFont(font)
+        self.progress_bar.setStyleSheet(theme.build_progressbar_stylesheet(height=height, chunk_color=chunk_color))
 
     def _apply_action_button_style(self, running: bool) -> None:
-        """统一设置开始/停止按钮样式。"""
-        height = int(getattr(self, "_control_height", theme.BUTTON_HEIGHT))
-        idle_style = theme.build_button_stylesheet(
-            height=height,
-            bg_color=theme.PRIMARY_BLUE,
-            hover_color=theme.PRIMARY_BLUE_HOVER,
-            disabled_bg=theme.PRIMARY_BLUE_DISABLED,
-            radius=theme.BUTTON_RADIUS,
-            pad_h=theme.BUTTON_PADDING_HORIZONTAL,
-            pad_v=theme.BUTTON_PADDING_VERTICAL,
-        )
-        running_style = theme.build_button_stylesheet(
-            height=height,
-            bg_color=theme.DANGER_RED,
-            hover_color=theme.DANGER_RED_HOVER,
-            disabled_bg=theme.DANGER_RED_DISABLED,
-            radius=theme.BUTTON_RADIUS,
-            pad_h=theme.BUTTON_PADDING_HORIZONTAL,
-            pad_v=theme.BUTTON_PADDING_VERTICAL,
-        )
+        """统一设置开始/停止按钮样式。
+
+        两套样式表按控件高度只构建一次并缓存；状态切换时仅替换样式表与文字。
+        """
+        height = self._control_height
+        cached = getattr(self, "_btn_styles", None)
+        if cached is None or cached[0] != height:
+            idle_style = theme.build_button_stylesheet(
+                height=height,
+                bg_color=theme.PRIMARY_BLUE,
+                hover_color=theme.PRIMARY_BLUE_HOVER,
+                disabled_bg=theme.PRIMARY_BLUE_DISABLED,
+                radius=theme.BUTTON_RADIUS,
+                pad_h=theme.BUTTON_PADDING_HORIZONTAL,
+                pad_v=theme.BUTTON_PADDING_VERTICAL,
+            )
+            running_style = theme.build_button_stylesheet(
+                height=height,
+                bg_color=theme.DANGER_RED,
+                hover_color=theme.DANGER_RED_HOVER,
+                disabled_bg=theme.DANGER_RED_DISABLED,
+                radius=theme.BUTTON_RADIUS,
+                pad_h=theme.BUTTON_PADDING_HORIZONTAL,
+                pad_v=theme.BUTTON_PADDING_VERTICAL,
+            )
+            cached = (height, idle_style, running_style)
+            self._btn_styles: Tuple[int, str, str] = cached
+            # 字体与高度只随样式重建时设置
+            try:
+                pb_font = self.progress_bar.font() if getattr(self, "progress_bar", None) is not None else None
+                if pb_font is not None:
+                    self.action_btn.setFont(pb_font)
+                self.action_btn.setFixedHeight(height)
+            except Exception:
+                pass
         try:
-            pb_font = self.progress_bar.font() if getattr(self, "progress_bar", None) is not None else None
-            if pb_font is not None:
-                self.action_btn.setFont(pb_font)
-            self.action_btn.setStyleSheet(running_style if running else idle_style)
-            self.action_btn.setFixedHeight(height)
+            self.action_btn.setStyleSheet(cached[2] if running else cached[1])
             self.action_btn.setText("停止" if running else "开始")
             self.action_btn.setToolTip("点击停止" if running else "点击开始")
         except Exception:
@@ -401,8 +650,8 @@ class BroadcastVideoSlicesTab(QtWidgets.QWidget):
         if not d:
             return
         try:
-            existing = {self.video_list.item(i).text() for i in range(self.video_list.count())}
-            if d not in existing:
+            if d not in self._video_set:
+                self._video_set.add(d)
                 self.video_list.addItem(d)
         except Exception:
             pass
@@ -418,24 +667,30 @@ class BroadcastVideoSlicesTab(QtWidgets.QWidget):
         if not files:
             return
         try:
-            existing = {self.video_list.item(i).text() for i in range(self.video_list.count())}
+            # 先过滤（扩展名 + 去重，与后台扫描共用 _VIDEO_EXTS），再一次性加入列表
+            new_files: List[str] = []
             for f in files:
-                if not f:
-                    continue
-                # 基本扩展名判断
-                ext = os.path.splitext(f)[1].lower()
-                if ext in {".mp4", ".avi", ".mov", ".mkv"}:
-                    if f not in existing:
-                        self.video_list.addItem(f)
+                if f and f not in self._video_set and os.path.splitext(f)[1].lower() in _VIDEO_EXTS:
+                    self._video_set.add(f)
+                    new_files.append(f)
+            if new_files:
+                self.video_list.setUpdatesEnabled(False)
+                try:
+                    self.video_list.addItems(new_files)
+                finally:
+                    self.video_list.setUpdatesEnabled(True)
         except Exception:
             pass
 
     def _on_remove_selected(self) -> None:
         """移除列表中选中的目录。"""
         try:
-            rows = self.video_list.selectedIndexes()
-            for idx in sorted(rows, key=lambda x: x.row(), reverse=True):
-                self.video_list.takeItem(idx.row())
+            # selectedRows 每行只返回一个索引；倒序删除避免行号前移
+            rows = sorted((i.row() for i in self.video_list.selectionModel().selectedRows()), reverse=True)
+            for row in rows:
+                item = self.video_list.takeItem(row)
+                if item is not None:
+                    self._video_set.discard(item.text())
         except Exception:
             pass
 
@@ -476,13 +731,18 @@ class BroadcastVideoSlicesTab(QtWidgets.QWidget):
         self._reset_table()
         self.progress_bar.setFormat("0 / %d" % len(inputs))
         self.progress_bar.setValue(0)
+        self._last_pct = 0
         self._thread = QtCore.QThread(self)
-        self._worker = BroadcastVideoSlicesWorker()
+        self._worker = BroadcastVideoSlicesWorker(slicer_cache=self._slicer_cache, preflight_ok=self._preflight_ok)
         self._worker.moveToThread(self._thread)
         self._worker.progress.connect(self._on_progress)
         self._worker.row_added.connect(self._on_row_added)
         self._worker.finished.connect(self._on_finished)
         self._worker.error.connect(self._on_error)
+        # 工作器结束时总让其线程退出，包括已被新一轮替换的旧线程
+        self._worker.finished.connect(self._thread.quit)
+        self._worker.error.connect(self._thread.quit)
+        self._thread.finished.connect(self._thread.deleteLater)
         self._worker.start.connect(self._worker.run)
         self._thread.started.connect(lambda: self._worker.start.emit(
             inputs,
@@ -493,6 +753,9 @@ class BroadcastVideoSlicesTab(QtWidgets.QWidget):
             bool(self.translate_chk.isChecked()),
             str(self.lang_combo.currentText()),
             int(self.cpl_spin.value()),
+            int(self.workers_spin.value()),
+            str(self.device_combo.currentText()),
+            str(self.compute_combo.currentText()),
         ))
         self._thread.start()
         self._is_running = True
@@ -502,36 +765,60 @@ class BroadcastVideoSlicesTab(QtWidgets.QWidget):
         """更新进度显示。"""
         try:
             self.progress_bar.setFormat(f"{done} / {total}")
-            pct = int(0 if total <= 0 else (done * 100.0 / total))
-            self.progress_bar.setValue(pct)
+            # 整数百分比；与上次相同时不再 setValue
+            pct = 0 if total <= 0 else (done * 100) // total
+            if pct != self._last_pct:
+                self._last_pct = pct
+                self.progress_bar.setValue(pct)
         except Exception:
             pass
 
     def _on_row_added(self, path: str, dur: float, size: int) -> None:
-        """加入一行结果。"""
-        r = self.table.rowCount()
-        self.table.insertRow(r)
-        self.table.setItem(r, 0, QtWidgets.QTableWidgetItem(path))
-        self.table.setItem(r, 1, QtWidgets.QTableWidgetItem(f"{dur:.2f}"))
-        mb = (size / (1024.0 * 1024.0)) if size > 0 else 0.0
-        self.table.setItem(r, 2, QtWidgets.QTableWidgetItem(f"{mb:.2f}"))
-        try:
+        """缓存一行结果，稍后批量写入表格。"""
+        self._pending_rows.append((path, dur, size))
+        if not self._row_flush_timer.isActive():
+            self._row_flush_timer.start()
+
+    def _flush_rows(self) -> None:
+        """将缓冲的结果行一次性追加到结果模型（一次插入通知与重绘）。"""
+        if not self._pending_rows:
+            return
+        rows = list(self._pending_rows)
+        self._pending_rows.clear()
+        self.result_model.append_rows(rows)
+        # 列宽只在首批结果到达时按视口宽度设置一次
+        if not self._columns_sized:
             vw = self.table.viewport().width()
             self.table.setColumnWidth(0, int(vw * 0.70))
             self.table.setColumnWidth(1, int(vw * 0.15))
             self.table.setColumnWidth(2, int(vw * 0.15))
-        except Exception:
-            pass
+            self._columns_sized = True
 
-    def _on_finished(self, done: int) -> None:
-        """任务完成后的复位。"""
+    def _on_finished(self, done: int, failures: list) -> None:
+        """任务完成后的复位；汇总显示失败的视频。
+
+        仅处理当前工作器发出的信号，避免上一轮迟到的 finished 清掉新一轮的线程。
+        """
+        if self.sender() is not self._worker:
+            return
+        self._row_flush_timer.stop()
+        self._flush_rows()
         self._cleanup_thread()
         self._is_running = False
         self._apply_action_button_style(False)
-        QtWidgets.QMessageBox.information(self, "完成", f"处理完成：{done}")
+        if failures:
+            details = "\n".join(failures[:20])
+            if len(failures) > 20:
+                details += f"\n…（共 {len(failures)} 个）"
+            QtWidgets.QMessageBox.warning(self, "完成", f"处理完成：{done}，其中失败 {len(failures)} 个：\n{details}")
+        else:
+            QtWidgets.QMessageBox.information(self, "完成", f"处理完成：{done}")
 
     def _on_error(self, msg: str) -> None:
-        """错误处理并复位按钮。"""
+        """致命错误处理并复位按钮（仅处理当前工作器发出的信号）。"""
+        if self.sender() is not self._worker:
+            return
+        self._flush_rows()
         QtWidgets.QMessageBox.critical(self, "错误", msg)
         self._cleanup_thread()
         self._is_running = False
@@ -540,6 +827,8 @@ class BroadcastVideoSlicesTab(QtWidgets.QWidget):
     def _cleanup_thread(self) -> None:
         """线程收尾。"""
         try:
+            if self._worker is not None and self._worker.preflight_ok:
+                self._preflight_ok = True
             if self._thread:
                 try:
                     self._worker.stop()
@@ -554,17 +843,35 @@ class BroadcastVideoSlicesTab(QtWidgets.QWidget):
             self._thread = None
             self._worker = None
 
+    def closeEvent(self, event: QtGui.QCloseEvent) -> None:  # type: ignore[override]
+        """关闭时停止后台线程并释放缓存的切片器与模型。"""
+        try:
+            self.request_stop()
+            self._cleanup_thread()
+            if self._slicer_cache:
+                self._slicer_cache.clear()
+                BroadcastVideoSlices.release_cached_models()
+        except Exception:
+            pass
+        try:
+            super().closeEvent(event)
+        except Exception:
+            pass
+
     def _reset_table(self) -> None:
         """清空结果表。"""
+        self._row_flush_timer.stop()
+        self._pending_rows.clear()
+        self._columns_sized = False
         try:
-            self.table.setRowCount(0)
+            self.result_model.clear()
         except Exception:
             pass
 
-    def _on_table_double_clicked(self, row: int, col: int) -> None:
+    def _on_table_double_clicked(self, index: QtCore.QModelIndex) -> None:
         """双击打开当前行文件。"""
         try:
-            p = self.table.item(row, 0).text()
+            p = self.result_model.path_at(index.row())
             if p:
                 _open_in_os(p)
         except Exception:
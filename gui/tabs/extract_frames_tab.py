@@ -25,10 +25,47 @@ import shutil
 from PySide6 import QtWidgets, QtCore, QtGui
 from gui.utils import theme
 from gui.precheck import run_preflight_checks
-import threading
+import itertools
+from collections import Counter
+import time
 from concurrent.futures import ThreadPoolExecutor, as_completed
 
 
+# 进度信号最小发射间隔（秒），约 20 Hz，避免大量跨线程信号挤占 GUI 事件循环
+_PROGRESS_EMIT_INTERVAL_S = 0.05
+
+# 截图写盘（PNG 编码 + 写文件）线程数；与解码并行，使总耗时接近两者中的较大者
+_FRAME_WRITER_THREADS = 2
+
+# 截图输出的图片扩展名（小写，含点；元组供 str.endswith 一次匹配）
+_IMAGE_EXTS = (".jpg", ".jpeg", ".png")
+
+
+def _count_images(root: str) -> int:
+    """统计 root 及其一级子目录中的图片数量（截图最多写到 <root>/<子目录>/ 一层）。
+
+    使用 os.scandir，DirEntry 的类型判断来自目录枚举结果，无需逐个文件 stat。
+    """
+    total = 0
+    try:
+        with os.scandir(root) as it:
+            for entry in it:
+                if entry.is_dir(follow_symlinks=False):
+                    try:
+                        with os.scandir(entry.path) as sub:
+                            total += sum(
+                                1 for e in sub
+                                if e.is_file(follow_symlinks=False) and e.name.lower().endswith(_IMAGE_EXTS)
+                            )
+                    except OSError:
+                        continue
+                elif entry.is_file(follow_symlinks=False) and entry.name.lower().endswith(_IMAGE_EXTS):
+                    total += 1
+    except OSError:
+        return total
+    return total
+
+
 class BusySpinner(QtWidgets.QWidget):
     """轻量级菊花转圈圈控件。
 
@@ -115,15 +152,15 @@ class ExtractFramesWorker(QtCore.QObject):
         Human-readable phase description.
     progress(int, int):
         Progress values (done, total). A simple 0..100 scale is used.
-    finished(str, int):
-        Emitted with (output_dir, image_count) when done.
+    finished(str, int, list):
+        Emitted with (output_dir, image_count, saved_paths) when done.
     error(str):
         Emitted when extraction fails.
     """
 
     phase = QtCore.Signal(str)
     progress = QtCore.Signal(int, int)
-    finished = QtCore.Signal(str, int)
+    finished = QtCore.Signal(str, int, list)
     error = QtCore.Signal(str)
     # 每次成功保存一张截图时，发射该图片的绝对路径
     image_saved = QtCore.Signal(str)
@@ -159,12 +196,10 @@ class ExtractFramesWorker(QtCore.QObject):
                 from cover_tool.extract_frames import (
                     is_video_file,
                     ensure_dir,
-                    probe_video_resolution,
-                    probe_video_duration_seconds,
+                    probe_video_meta,
                     compute_sharpest_frame_cv_gpu,
-                    compute_sharpest_frame_cv,
+                    iter_sharpest_frames_cv,
                     save_frame_cv,
-                    generate_unique_random_name,
                 )
             except Exception as e:
                 self.error.emit(f"导入抽帧逻辑失败: {e}")
@@ -184,13 +219,29 @@ class ExtractFramesWorker(QtCore.QObject):
             videos = [f for f in entries if is_video_file(f) and os.path.isfile(os.path.join(video_dir, f))]
 
             # 按照视频分辨率，统计每种分辨率下的视频个数，对少于20个视频的分辨率，则去掉截取的必要
-            res_count = {}
-            for video in videos:
-                wh = probe_video_resolution(os.path.join(video_dir, video))
-                res_count[wh] = res_count.get(wh, 0) + 1
-            unknown_resolution_videos = [v for v in videos if res_count.get(probe_video_resolution(os.path.join(video_dir, v)), 0) < filter_count]
-            videos = [v for v in videos if v not in unknown_resolution_videos]
-           
+            # 每个视频只打开一次，同时读取分辨率与时长：分辨率用于统计与过滤，
+            # 时长缓存供后续计算时间窗；探测为 I/O 型调用，并发执行，并以 已探测/视频数 反馈扫描进度
+            self.phase.emit("Scanning videos (parallel)…")
+            resolutions = {}
+            durations = {}
+            probe_total = len(videos)
+            self.progress.emit(0, probe_total)
+            with ThreadPoolExecutor(max_workers=max(4, int(threads))) as ex:
+                probe_futures = {ex.submit(probe_video_meta, os.path.join(video_dir, v)): v for v in videos}
+                for f in as_completed(probe_futures):
+                    if self._stopping:
+                        for pf in probe_futures:
+                            pf.cancel()
+                        break
+                    v = probe_futures[f]
+                    resolutions[v], durations[v] = f.result()
+                    self.progress.emit(len(resolutions), probe_total)
+            if self._stopping:
+                self.error.emit("任务已取消")
+                return
+            res_count = Counter(resolutions.values())
+            # 单次遍历保留满足数量阈值的分辨率下的视频（保持原顺序）
+            videos = [v for v in videos if res_count[resolutions[v]] >= filter_count]
 
             shots_for_total = max(1, int(count))
             total_tasks = len(videos) * shots_for_total
@@ -203,34 +254,47 @@ class ExtractFramesWorker(QtCore.QObject):
             except Exception:
                 pass
 
-            # 线程安全计数器
-            done_lock = threading.Lock()
-            done_count = 0
-
-            def _emit_progress():
-                # 直接发射“已完成/总数”计数，以便 UI 准确显示
-                with done_lock:
-                    current = done_count
+            # 完成计数器：itertools.count 的 next() 由 C 实现，在 GIL 下原子递增，无需加锁
+            done_counter = itertools.count(1)
+
+            last_emit = 0.0
+            last_emitted = 0
+
+            def _emit_progress(current: int) -> None:
+                # 发射“已完成/总数”计数；限频，最后一个任务完成时总会发射。
+                # 限频状态的读写不加锁：竞争时至多多发或少发一次，且不会回退已显示的计数
+                nonlocal last_emit, last_emitted
+                now = time.monotonic()
+                if current < total_tasks and now - last_emit < _PROGRESS_EMIT_INTERVAL_S:
+                    return
+                if current <= last_emitted:
+                    return
+                last_emit = now
+                last_emitted = current
                 self.progress.emit(current, total_tasks)
 
-            # 单视频处理函数
+            # 输出目录与每视频截图数对所有视频相同，在分发任务前计算一次
+            # 不在物理上区分分辨率，只通过视频文件属性来区分（目录已在上方创建）
+            out_parent_dir = output_dir
+            shots = shots_for_total
+
+            # 本次运行成功保存的截图路径（list.append 在 GIL 下线程安全），随 finished 回传给 UI
+            saved_paths: list[str] = []
+
+            # 截图文件名：进程号 + 毫秒时间戳在每次运行时生成一次，再拼接递增序号，
+            # 不同运行/进程之间不会重名，保存前无需逐个 os.path.exists 检查
+            run_id = f"{os.getpid()}_{int(time.time() * 1000)}"
+            name_counter = itertools.count(1)
+
+            # 单视频处理函数（分辨率与时长已在扫描阶段探测，此处不再打开视频读取元数据）
             def process_one(video_filename: str) -> int:
-                nonlocal done_count
+                # 已请求停止时，刚被线程池取出的任务直接返回，不再探测/解码
+                if self._stopping:
+                    return 0
                 in_path = os.path.join(video_dir, video_filename)
-                # 分辨率分组目录：<output_dir>/<WxH>/<rel>
-                # wh = probe_video_resolution(in_path)
-                # res_dir = os.path.join(output_dir, f"{wh[0]}x{wh[1]}" if wh else "unknown_resolution")
-                res_dir = output_dir # 不在物理上区分分辨率，之通过视频文件属性来区分
-                ensure_dir(res_dir)
-                out_parent_dir = res_dir  # 非递归，直接使用分辨率层
-
-                # 计算时间窗
-                try:
-                    total_dur = probe_video_duration_seconds(in_path) or 5.0
-                except Exception:
-                    total_dur = 5.0
-                total_dur = max(0.5, float(total_dur))
-                shots = max(1, int(count))
+
+                # 计算时间窗（时长探测失败时按 5 秒处理）
+                total_dur = max(0.5, float(durations.get(video_filename) or 5.0))
                 window_edges: List[Tuple[float, float]] = []
                 if shots == 1:
                     window_edges = [(0.0, total_dur)]
@@ -244,43 +308,65 @@ class ExtractFramesWorker(QtCore.QObject):
                         window_edges.append((start, end))
                         start = end
 
-                saved = 0
-                for (win_start, win_end) in window_edges:
-                    if self._stopping:
-                        break
-                    ok_best, best_img, info_msg, best_score, best_num = compute_sharpest_frame_cv_gpu(in_path)
-                    if not ok_best:
-                        ok_best, best_img, info_msg, best_score, best_num = compute_sharpest_frame_cv(
-                            in_path,
-                            start_time_sec=win_start,
-                            end_time_sec=win_end,
-                        )
-                if ok_best and best_img is not None:
-                    ext = "png"
-                    safe_name = generate_unique_random_name(out_parent_dir, ext, length=12)
-                    out_path = os.path.join(out_parent_dir, f"{safe_name}.{ext}")
-                    ok_save, msg_save = save_frame_cv(best_img, out_path, fmt=ext, quality=2)
-                    if ok_save:
-                        saved += 1
-                        # 通知 UI 展示最新生成的截图预览
-                        try:
-                            self.image_saved.emit(out_path)
-                        except Exception:
-                            pass
+                queued = 0
+                for ok_best, best_img, info_msg, best_score, best_num in _scan_windows(in_path, window_edges):
+                    if ok_best and best_img is not None:
+                        # 保存交给写盘线程，当前线程继续解码下一个时间窗
+                        out_path = os.path.join(out_parent_dir, f"{run_id}_{next(name_counter)}.png")
+                        writer.submit(_save_frame, best_img, out_path)
+                        queued += 1
                     # 无论窗口是否成功保存，都推进进度
-                    with done_lock:
-                        done_count += 1
-                    _emit_progress()
-                return saved
+                    _emit_progress(next(done_counter))
+                return queued
+
+            def _scan_windows(in_path: str, window_edges: List[Tuple[float, float]]):
+                """逐个时间窗产出最清晰帧：优先 GPU；GPU 失败后剩余时间窗由 CPU 单次顺序解码完成。"""
+                for idx, (win_start, win_end) in enumerate(window_edges):
+                    if self._stopping:
+                        return
+                    result = compute_sharpest_frame_cv_gpu(
+                        in_path,
+                        start_time_sec=win_start,
+                        end_time_sec=win_end,
+                    )
+                    if result[0]:
+                        yield result
+                        continue
+                    # GPU 路径耗时较长，回退到 CPU 扫描前再确认一次是否已停止
+                    if self._stopping:
+                        return
+                    # 剩余时间窗共用一个 CPU 解码器顺序扫描，不再逐窗重新打开与定位；
+                    # 停止时提前返回，内层生成器随之关闭并释放解码器
+                    for result in iter_sharpest_frames_cv(in_path, window_edges[idx:]):
+                        yield result
+                        if self._stopping:
+                            return
+                    return
+
+            def _save_frame(img, out_path: str) -> None:
+                ok_save, msg_save = save_frame_cv(img, out_path, fmt="png", quality=2)
+                if ok_save:
+                    saved_paths.append(out_path)
+                    # 通知 UI 展示最新生成的截图预览
+                    try:
+                        self.image_saved.emit(out_path)
+                    except Exception:
+                        pass
 
             # 并发执行
             self.phase.emit("Extracting frames…")
             max_workers = max(1, int(threads))
             try:
-                with ThreadPoolExecutor(max_workers=max_workers) as ex:
+                # 写盘线程池在解码线程池之后退出：先等待全部扫描结束，再等待排队中的截图写完
+                with ThreadPoolExecutor(max_workers=_FRAME_WRITER_THREADS) as writer, \
+                        ThreadPoolExecutor(max_workers=max_workers) as ex:
                     futures = [ex.submit(process_one, v) for v in videos]
                     for f in as_completed(futures):
                         if self._stopping:
+                            # 取消尚未开始的任务；正在运行的任务会在下一个时间窗前检查停止标记并返回
+                            for fut in futures:
+                                fut.cancel()
+                            ex.shutdown(wait=False, cancel_futures=True)
                             break
                         # 单帧进度已在 worker 中更新
             except Exception as e:
@@ -289,12 +375,10 @@ class ExtractFramesWorker(QtCore.QObject):
 
             # 完成统计
             self.phase.emit("Counting results…")
-            total_images = 0
-            for dirpath, dirnames, filenames in os.walk(output_dir):
-                total_images += sum(1 for f in filenames if os.path.splitext(f)[1].lower() in {".jpg", ".jpeg", ".png"})
+            total_images = _count_images(output_dir)
             # 结束时发射 total_tasks / total_tasks
             self.progress.emit(total_tasks, total_tasks)
-            self.finished.emit(output_dir, total_images)
+            self.finished.emit(output_dir, total_images, saved_paths)
         except Exception as e:
             self.error.emit(f"生成截图失败: {e}")
 
@@ -838,10 +922,16 @@ class ExtractFramesTab(QtWidgets.QWidget):
         except Exception:
             pass
 
-    def _on_finished(self, out_dir: str, count: int) -> None:
+    def _on_finished(self, out_dir: str, count: int, saved_paths: list) -> None:
         """Handle successful completion: update results table and reset UI."""
-        # 根据截图目录下的分辨率子目录填充结果表
-        self._populate_results_by_resolution(out_dir)
+        if count <= 0:
+            # 没有任何截图：无需再扫描目录
+            self.results_table.setRowCount(0)
+        else:
+            # 目录中的图片全部来自本次运行时，直接用回传的路径填表，免去重新遍历目录；
+            # 保留了旧截图等情况仍回退到扫描
+            known = saved_paths if len(saved_paths) == count else None
+            self._populate_results_by_resolution(out_dir, known)
 
         # 复位 UI
         self._is_running = False
@@ -937,7 +1027,7 @@ class ExtractFramesTab(QtWidgets.QWidget):
         except Exception:
             pass
 
-    def _populate_results_by_resolution(self, out_dir: str) -> None:
+    def _populate_results_by_resolution(self, out_dir: str, images: Optional[list] = None) -> None:
         """Populate the results table with all image files and their resolutions.
 
         遍历传入目录下的所有图片文件（递归）：
@@ -949,50 +1039,59 @@ class ExtractFramesTab(QtWidgets.QWidget):
         ----------
         out_dir : str
             要扫描的根目录。将递归遍历其子目录，收集扩展名为 .jpg/.jpeg/.png 的图片文件。
+        images : list, optional
+            已知的图片路径列表（如工作线程本次保存的截图）；提供时直接使用，不再扫描目录。
         """
         try:
             self.results_table.setRowCount(0)
-            if not out_dir or not os.path.isdir(out_dir):
+            if images is None and (not out_dir or not os.path.isdir(out_dir)):
                 return
-            exts = {".jpg", ".jpeg", ".png"}
-
-            # 收集所有匹配的图片文件（递归）
+            # 收集所有匹配的图片文件（递归）；os.scandir 的 DirEntry 自带类型信息，无需逐个 isfile
             all_images: list[str] = []
             display_lines = 30
-            try:
-                for dirpath, dirnames, filenames in os.walk(out_dir):
-                    for f in filenames:
-                        fp = os.path.join(dirpath, f)
-                        if os.path.isfile(fp) and os.path.splitext(f)[1].lower() in exts:
-                            all_images.append(fp)
-                            if len(all_images) > display_lines:
-                                break
-                    if len(all_images) > display_lines:
-                        break
-            except Exception:
-                pass
-
-            # 稳定排序后填充表格
-            
-            for fp in sorted(all_images):
-                # 读取图片分辨率（WxH）；失败则显示 unknown
-                res_text = "unknown"
+            if images is not None:
+                all_images = sorted(images)[:display_lines + 1]
+            pending_dirs = [] if images is not None else [out_dir]
+            while pending_dirs and len(all_images) <= display_lines:
                 try:
-                    img = QtGui.QImage(fp)
-                    if not img.isNull():
-                        res_text = f"{img.width()}x{img.height()}"
-                except Exception:
-                    pass
-
-                row = self.results_table.rowCount()
-                self.results_table.insertRow(row)
-                self.results_table.setItem(row, 0, QtWidgets.QTableWidgetItem(fp))
-                self.results_table.setItem(row, 1, QtWidgets.QTableWidgetItem(res_text))
-            # 增加一行，提示是：查看更多，请到 out_dir 查看
-            row = self.results_table.rowCount()
-            self.results_table.insertRow(row)
-            self.results_table.setItem(row, 0, QtWidgets.QTableWidgetItem(out_dir))
-            self.results_table.setItem(row, 1, QtWidgets.QTableWidgetItem("查看更多，双击打开目录..."))
+                    with os.scandir(pending_dirs.pop(0)) as it:
+                        for e in it:
+                            if e.is_dir(follow_symlinks=False):
+                                pending_dirs.append(e.path)
+                            elif e.is_file(follow_symlinks=False) and e.name.lower().endswith(_IMAGE_EXTS):
+                                all_images.append(e.path)
+                                if len(all_images) > display_lines:
+                                    break
+                except OSError:
+                    continue
+
+            # 稳定排序后填充表格：先一次性设定行数（末尾多一行“查看更多”），
+            # 并在填充期间关闭重绘/排序，避免逐行 insertRow 触发的布局失效与重排
+            rows = sorted(all_images)
+            table = self.results_table
+            was_sorting = table.isSortingEnabled()
+            table.setUpdatesEnabled(False)
+            table.setSortingEnabled(False)
+            try:
+                table.setRowCount(len(rows) + 1)
+                for row, fp in enumerate(rows):
+                    # 读取图片分辨率（WxH）；失败则显示 unknown
+                    res_text = "unknown"
+                    try:
+                        img = QtGui.QImage(fp)
+                        if not img.isNull():
+                            res_text = f"{img.width()}x{img.height()}"
+                    except Exception:
+                        pass
+                    table.setItem(row, 0, QtWidgets.QTableWidgetItem(fp))
+                    table.setItem(row, 1, QtWidgets.QTableWidgetItem(res_text))
+                # 增加一行，提示是：查看更多，请到 out_dir 查看
+                row = len(rows)
+                table.setItem(row, 0, QtWidgets.QTableWidgetItem(out_dir))
+                table.setItem(row, 1, QtWidgets.QTableWidgetItem("查看更多，双击打开目录..."))
+            finally:
+                table.setSortingEnabled(was_sorting)
+                table.setUpdatesEnabled(True)
         except Exception:
             pass
 
@@ -32,7 +32,6 @@ from __future__ import annotations
 
 import os
 import shutil
-import subprocess
 import random
 import time
 from pathlib import Path
@@ -44,13 +43,14 @@ from concurrent.futures import ThreadPoolExecutor, as_completed
 from utils.bootstrap_ffmpeg import bootstrap_ffmpeg_env  # type: ignore
 bootstrap_ffmpeg_env(prefer_bundled=True, dev_fallback_env=True, modify_env=True)
 
-from concat_tool.normalize_video import VideoNormalizer  # type: ignore
 from concat_tool.concat import VideoConcat  # type: ignore
 from gui.utils import theme
 from gui.precheck import run_preflight_checks
 from utils.calcu_video_info import probe_resolution, get_resolution_dir_topn, confirm_resolution_dir, ffprobe_duration
-from utils.common_utils import is_video_file, is_image_file
+from utils.common_utils import is_video_file
 
+# 平台判定在模块加载时计算一次，打开文件/目录时无需逐次比较字符串
+_IS_WINDOWS = os.name == "nt"
 class ConcatWorker(QtCore.QObject):
     """后台混剪工作者：先归一化素材，再按分辨率分组进行拼接。
 
@@ -118,14 +118,6 @@ class ConcatWorker(QtCore.QObject):
         self._stopping = True
 
     # ----------------------------- 内部辅助方法 ----------------------------- #
-    def _emit(self, text: str) -> None:
-        """安全发射日志文本。"""
-        # try:
-        #     self.log.emit(str(text))
-        # except Exception:
-        #     pass
-        pass
-
     def _choose_bgm_path(self) -> Optional[Path]:
         """选择用于混剪的背景音乐文件路径。
 
@@ -204,7 +196,6 @@ class ConcatWorker(QtCore.QObject):
         # 选择视频数量最多的分辨率组，若并列则取面积更大的分辨率
         best_res = max(groups.keys(), key=lambda r: (len(groups[r]), r[0] * r[1]))
         candidates = groups.get(best_res, [])
-        self._emit(f"📹 选择分辨率组 {best_res[0]}x{best_res[1]}，素材数 {len(candidates)}")
         if not candidates:
             self.error.emit("分辨率分组失败：候选为空")
             return None
@@ -213,7 +204,6 @@ class ConcatWorker(QtCore.QObject):
             self.phase.emit("concat")
         except Exception:
             pass
-        self._emit("🎬 开始生成混剪视频…（不再额外裁剪）")
 
         success: List[str] = []
         fail = 0
@@ -336,14 +326,6 @@ class ConcatWorker(QtCore.QObject):
             self.results.emit(success)
         except Exception:
             pass
-        if success:
-            self._emit("\n🎉 成功生成的文件:")
-            for p in success:
-                try:
-                    size_mb = Path(p).stat().st_size / (1024 * 1024)
-                    self._emit(f"  - {p} ({size_mb:.1f} MB)")
-                except Exception:
-                    self._emit(f"  - {p}")
 
 
 class VideoConcatTab(QtWidgets.QWidget):
@@ -359,6 +341,12 @@ class VideoConcatTab(QtWidgets.QWidget):
         self._worker: Optional[ConcatWorker] = None
         self._is_running: bool = False
 
+        # 进度合并刷新：worker 仅暂存最新 (done, total)，由定时器约 60Hz 统一刷新进度条
+        self._pending_progress: Optional[Tuple[int, int]] = None
+        self._progress_timer = QtCore.QTimer(self)
+        self._progress_timer.setInterval(16)
+        self._progress_timer.timeout.connect(self._flush_progress)
+
         # 左侧控件引用
         self.video_list: Optional[QtWidgets.QListWidget] = None
         self.bgm_edit: Optional[QtWidgets.QLineEdit] = None
@@ -459,17 +447,9 @@ class VideoConcatTab(QtWidgets.QWidget):
         self.outputs_spin = QtWidgets.QSpinBox()
         self.outputs_spin.setRange(1, 1000)
         self.outputs_spin.setValue(3)
-        # 支持手动输入并即时解析
-        self.outputs_spin.setKeyboardTracking(True)
-        self.outputs_spin.setAccelerated(True)
-        self.outputs_spin.setFocusPolicy(QtCore.Qt.StrongFocus)
         self.slices_spin = QtWidgets.QSpinBox()
         self.slices_spin.setRange(1, 1000)
         self.slices_spin.setValue(8)
-        # 支持手动输入并即时解析
-        self.slices_spin.setKeyboardTracking(True)
-        self.slices_spin.setAccelerated(True)
-        self.slices_spin.setFocusPolicy(QtCore.Qt.StrongFocus)
         g2.addRow("混剪视频数量", self.outputs_spin)
         g2.addRow("每个混剪切片数", self.slices_spin)
 
@@ -486,28 +466,25 @@ class VideoConcatTab(QtWidgets.QWidget):
         self.concurrency_spin = QtWidgets.QSpinBox()
         self.concurrency_spin.setRange(1, 32)
         self.concurrency_spin.setValue(4)
-        # 支持手动输入并即时解析
-        self.concurrency_spin.setKeyboardTracking(True)
-        self.concurrency_spin.setAccelerated(True)
-        self.concurrency_spin.setFocusPolicy(QtCore.Qt.StrongFocus)
         g2.addRow("合成质量档位", self.quality_combo)
         g2.addRow("并发数量", self.concurrency_spin)
 
+        # 数值输入框统一配置：支持手动输入并即时解析
+        strong_focus = QtCore.Qt.StrongFocus
+        for spin in (self.outputs_spin, self.slices_spin, self.concurrency_spin):
+            spin.setKeyboardTracking(True)
+            spin.setAccelerated(True)
+            spin.setFocusPolicy(strong_focus)
 
         # 放入垂直 Splitter 以获得更好的伸缩控制
         vsplit = QtWidgets.QSplitter(QtCore.Qt.Vertical)
-        try:
-            group1.setSizePolicy(QtWidgets.QSizePolicy.Preferred, QtWidgets.QSizePolicy.Maximum)
-            group2.setSizePolicy(QtWidgets.QSizePolicy.Preferred, QtWidgets.QSizePolicy.Maximum)
-        except Exception:
-            pass
+        preferred = QtWidgets.QSizePolicy.Preferred
+        group1.setSizePolicy(preferred, QtWidgets.QSizePolicy.Maximum)
+        group2.setSizePolicy(preferred, QtWidgets.QSizePolicy.Maximum)
         vsplit.addWidget(group1)
         vsplit.addWidget(group2)
         spacer = QtWidgets.QWidget()
-        try:
-            spacer.setSizePolicy(QtWidgets.QSizePolicy.Preferred, QtWidgets.QSizePolicy.Expanding)
-        except Exception:
-            pass
+        spacer.setSizePolicy(preferred, QtWidgets.QSizePolicy.Expanding)
         vsplit.addWidget(spacer)
         vsplit.setStretchFactor(0, 0)
         vsplit.setStretchFactor(1, 0)
@@ -539,7 +516,8 @@ class VideoConcatTab(QtWidgets.QWidget):
         except Exception:
             pass
         self.start_stop_btn = QtWidgets.QPushButton("开始")
-        self.start_stop_btn.clicked.connect(self._on_start_stop_clicked)
+        # 按钮与槽同属 GUI 线程，直接调用
+        self.start_stop_btn.clicked.connect(self._on_start_stop_clicked, QtCore.Qt.DirectConnection)
         ctl_row.addWidget(self.progress_bar, 1)
         ctl_row.addWidget(self.start_stop_btn)
         status_vbox.addLayout(ctl_row)
@@ -926,14 +904,16 @@ class VideoConcatTab(QtWidgets.QWidget):
                 concurrency=settings["concurrency"],
             )
             self._worker.moveToThread(self._thread)
-            # 信号连接
+            # 信号连接：worker 信号跨线程发射，显式使用 QueuedConnection，省去运行时的线程归属判断
             self._thread.started.connect(self._worker.run)
-            self._worker.phase.connect(self._on_phase)
-            self._worker.progress.connect(self._on_progress)
-            self._worker.error.connect(self._on_error)
-            self._worker.finished.connect(self._on_finished)
-            self._worker.results.connect(self._on_results)
-            # 线程结束清理
+            queued = QtCore.Qt.QueuedConnection
+            self._worker.phase.connect(self._on_phase, queued)
+            self._worker.progress.connect(self._stash_progress, queued)
+            self._worker.error.connect(self._on_error, queued)
+            self._worker.finished.connect(self._on_finished, queued)
+            self._worker.results.connect(self._on_results, queued)
+            # 线程结束清理：由 finished 信号回调释放引用，GUI 线程无需阻塞等待
+            self._thread.finished.connect(self._on_thread_finished)
             self._thread.finished.connect(self._thread.deleteLater)
             # 更新 UI 状态
             self._is_running = True
@@ -946,6 +926,8 @@ class VideoConcatTab(QtWidgets.QWidget):
             # 清空旧结果
             self.results_table.setRowCount(0)
             # 启动
+            self._pending_progress = None
+            self._progress_timer.start()
             self._thread.start()
         else:
             # 请求停止
@@ -959,6 +941,8 @@ class VideoConcatTab(QtWidgets.QWidget):
         - 归一化阶段占 30%，文本显示为“归一化：完成数 | 待转换总数”。
         - 合成阶段占 70%，文本显示为“混合视频：完成数 | 待合成总数”。
         """
+        # 先刷新上一阶段尚未显示的进度，避免其按新阶段权重被错误映射
+        self._flush_progress()
         try:
             self._phase_name = str(name)
             if name == "normalize":
@@ -976,6 +960,18 @@ class VideoConcatTab(QtWidgets.QWidget):
         except Exception:
             pass
 
+    def _stash_progress(self, done: int, total: int) -> None:
+        """暂存最新进度，等待定时器统一刷新，避免高频信号逐次重绘进度条。"""
+        self._pending_progress = (done, total)
+
+    def _flush_progress(self) -> None:
+        """取出暂存的进度并刷新进度条；无新进度时直接返回。"""
+        pending = self._pending_progress
+        if pending is None:
+            return
+        self._pending_progress = None
+        self._on_progress(*pending)
+
     def _on_progress(self, done: int, total: int) -> None:
         """更新进度条的分段进度与文本，显示“完成数 | 总数”。
 
@@ -1032,16 +1028,16 @@ class VideoConcatTab(QtWidgets.QWidget):
             if dlg.clickedButton() == open_btn:
                 out_dir = self._get_effective_output_dir()
                 if out_dir and out_dir.exists():
-                    try:
-                        QtGui.QDesktopServices.openUrl(QtCore.QUrl.fromLocalFile(str(out_dir)))
-                    except Exception:
+                    out_str = str(out_dir)
+                    opened = QtGui.QDesktopServices.openUrl(QtCore.QUrl.fromLocalFile(out_str))
+                    if not opened and _IS_WINDOWS:
                         try:
-                            if os.name == "nt":
-                                os.startfile(str(out_dir))  # type: ignore[attr-defined]
-                            else:
-                                QtGui.QDesktopServices.openUrl(QtCore.QUrl.fromLocalFile(str(out_dir)))
+                            os.startfile(out_str)  # type: ignore[attr-defined]
+                            opened = True
                         except Exception:
-                            QtWidgets.QMessageBox.warning(self, "提示", f"无法打开目录：{out_dir}")
+                            pass
+                    if not opened:
+                        QtWidgets.QMessageBox.warning(self, "提示", f"无法打开目录：{out_dir}")
                 else:
                     QtWidgets.QMessageBox.warning(self, "提示", "输出目录不存在或不可用")
         except Exception:
@@ -1080,9 +1076,25 @@ class VideoConcatTab(QtWidgets.QWidget):
         return None
 
     def _on_results(self, paths: List[str]) -> None:
-        """将结果填充到表格（路径、分辨率、大小），支持双击打开。"""
-        self.results_table.setRowCount(0)
-        for p in paths:
+        """将结果填充到表格（路径、分辨率、大小），支持双击打开。
+
+        填充期间暂停表格重绘与信号，并一次性预设行数，避免逐行插入触发多次布局。
+        """
+        table = self.results_table
+        table.setUpdatesEnabled(False)
+        table.blockSignals(True)
+        try:
+            table.setRowCount(0)
+            table.setRowCount(len(paths))
+            self._fill_result_rows(paths)
+        finally:
+            table.blockSignals(False)
+            table.setUpdatesEnabled(True)
+            table.viewport().update()
+
+    def _fill_result_rows(self, paths: List[str]) -> None:
+        """按行写入结果（表格行数已由调用方预设）。"""
+        for row, p in enumerate(paths):
             pt = Path(p)
             dur = ffprobe_duration(pt)
             # 秒转换成 HH:MM:SS
@@ -1094,8 +1106,6 @@ class VideoConcatTab(QtWidgets.QWidget):
                 size_text = f"{size_mb:.1f} MB"
             except Exception:
                 size_text = "?"
-            row = self.results_table.rowCount()
-            self.results_table.insertRow(row)
             self.results_table.setItem(row, 0, QtWidgets.QTableWidgetItem(p))
             self.results_table.setItem(row, 1, QtWidgets.QTableWidgetItem(str(dur) if dur else "?"))
             self.results_table.setItem(row, 2, QtWidgets.QTableWidgetItem(size_text))
@@ -1110,17 +1120,20 @@ class VideoConcatTab(QtWidgets.QWidget):
         if not item:
             return
         path = item.text()
-        try:
-            if os.name == "nt":
+        if _IS_WINDOWS:
+            try:
                 os.startfile(path)  # type: ignore[attr-defined]
-            else:
-                QtGui.QDesktopServices.openUrl(QtCore.QUrl.fromLocalFile(path))
-        except Exception:
-            QtGui.QDesktopServices.openUrl(QtCore.QUrl.fromLocalFile(path))
+                return
+            except Exception:
+                pass
+        QtGui.QDesktopServices.openUrl(QtCore.QUrl.fromLocalFile(path))
 
     def _reset_run_state(self) -> None:
         """复位运行状态与按钮文本，安全清理线程。"""
         self._is_running = False
+        # 停止进度定时器前刷新最后一次暂存的进度
+        self._progress_timer.stop()
+        self._flush_progress()
         try:
             self.start_stop_btn.setText("开始")
             self.start_stop_btn.setEnabled(True)
@@ -1132,9 +1145,19 @@ class VideoConcatTab(QtWidgets.QWidget):
             pass
         try:
             if self._thread and self._thread.isRunning():
+                # 仅请求退出事件循环；线程真正结束后由 _on_thread_finished 收尾
                 self._thread.quit()
-                self._thread.wait(3000)
         except Exception:
             pass
 
+    def _on_thread_finished(self) -> None:
+        """线程退出后的收尾：释放线程与 worker 引用。
+
+        仅处理当前线程发出的信号，避免上一轮线程迟到的 finished 清掉新一轮的引用。
+        """
+        if self.sender() is not self._thread:
+            return
+        self._thread = None
+        self._worker = None
+
 __all__ = ["VideoConcatTab"]
@@ -47,6 +47,7 @@ class BroadcastVideoSlices:
         model_size: Optional[str] = None,
         device: str = "auto",
         models_root: Optional[str] = None,
+        compute_type: Optional[str] = None,
     ) -> None:
         """初始化切片器并加载 Whisper 模型。
 
@@ -55,6 +56,8 @@ class BroadcastVideoSlices:
         model_size: Whisper 模型大小（例如 "large-v3"、"medium"、"small"），缺省自动选择
         device: 运行设备（"auto"/"cuda"/"cpu"），默认自动选择
         models_root: 模型基础目录，需包含子目录 faster_wishper 与 florence2
+        compute_type: Whisper 推理精度（"float16"/"int8_float16"/"int8" 等），缺省时 cuda 用 float16、cpu 用 int8；
+            cpu 不支持 float16 计算，含 float16 的取值在 cpu 上回退为 int8
         """
         self._WhisperModel = WhisperModel  # type: ignore
         self.model_size = model_size or self._auto_select_model_size()
@@ -65,7 +68,11 @@ class BroadcastVideoSlices:
         self.models_root = os.path.abspath(models_root)
         self.whisper_model_dir_base = os.path.join(self.models_root, "faster_wishper")
         whisper_model_path = self._pick_model_dir(self.whisper_model_dir_base, self._map_model_to_repo(self.model_size))
-        self.compute_type = "float16" if self.device == "cuda" else "int8"
+        if not compute_type:
+            compute_type = "float16" if self.device == "cuda" else "int8"
+        elif self.device != "cuda" and "float16" in compute_type:
+            compute_type = "int8"
+        self.compute_type = compute_type
 
         # wishper 模型
         self.model = self._get_or_create_model(whisper_model_path, self.device, self.compute_type)
@@ -84,6 +91,18 @@ class BroadcastVideoSlices:
             "vision_model": self.vision_model_id,
         })
 
+    @classmethod
+    def release_cached_models(cls) -> None:
+        """释放类级缓存的 Whisper 与 Florence-2 模型，并尝试回收显存。"""
+        with cls._CACHE_LOCK:
+            cls._MODEL_CACHE.clear()
+            cls._VISION_CACHE.clear()
+        try:
+            if torch and torch.cuda.is_available():
+                torch.cuda.empty_cache()
+        except Exception:
+            pass
+
     def _auto_pick_device(self, device: str) -> str:
         """自动选择运行设备。"""
         if device != "auto":
@@ -112,7 +131,8 @@ class BroadcastVideoSlices:
         """构建或复用 Florence-2 模型与处理器并做单例缓存。"""
         if AutoProcessor is None or AutoModelForCausalLM is None:
             raise ImportError("transformers 未安装或不可用")
-        device = "cuda" if (torch and torch.cuda.is_available()) else "cpu"
+        # 与 Whisper 使用同一设备：显式选择 cpu 时 Florence-2 也不占用显存
+        device = "cuda" if (self.device == "cuda" and torch and torch.cuda.is_available()) else "cpu"
         model_id = str(self.vision_model_id)
         key = f"{os.path.abspath(model_id)}|{device}"
         cached = self._VISION_CACHE.get(key)
@@ -123,7 +143,7 @@ class BroadcastVideoSlices:
             if cached2:
                 return cached2
             kwargs: Dict[str, Any] = {"trust_remote_code": True, "attn_implementation": "eager"}
-            if torch and torch.cuda.is_available():
+            if device == "cuda":
                 try:
                     kwargs["dtype"] = torch.float16
                 except Exception:
@@ -642,8 +662,19 @@ class BroadcastVideoSlices:
         xprint({"phase": "jumpcut_clusters", "count": len(clusters)})
         return clusters
 
-    def _render_jump_cuts(self, video_path: str, output_dir: str, clusters: List[List[Any]], crf: int = 23, use_nvenc: bool = False) -> List[str]:
-        """渲染跳剪输出：将离散句子片段重编码后用 concat 合并为短视频。"""
+    def _render_jump_cuts(
+        self,
+        video_path: str,
+        output_dir: str,
+        clusters: List[List[Any]],
+        crf: int = 23,
+        use_nvenc: bool = False,
+        durations: Optional[Dict[str, float]] = None,
+    ) -> List[str]:
+        """渲染跳剪输出：将离散句子片段重编码后用 concat 合并为短视频。
+
+        durations: 可选，传入时写入 {输出路径: 时长(秒)}，供调用方免去再次探测
+        """
         os.makedirs(output_dir, exist_ok=True)
         name = os.path.splitext(os.path.basename(video_path))[0]
         temp_dir = os.path.join(output_dir, "temp_jump_chunks")
@@ -700,6 +731,8 @@ class BroadcastVideoSlices:
                 seg_dur = 0.0
             xprint({"phase": "jumpcut_render_done", "index": i + 1, "out": out_path, "chunks": len(chunk_paths), "duration": round(seg_dur, 3)})
             outs.append(out_path)
+            if durations is not None:
+                durations[out_path] = seg_dur
             total_export_duration += seg_dur
         try:
             shutil.rmtree(temp_dir)
@@ -716,11 +749,21 @@ class BroadcastVideoSlices:
         xprint({"phase": "jumpcut_all_done", "outputs": len(outs)})
         return outs
 
-    def cut_video(self, video_path: str, output_dir: Optional[str] = None, mode: str = "ecommerce", **kwargs: Any) -> List[str]:
+    def cut_video(
+        self,
+        video_path: str,
+        output_dir: Optional[str] = None,
+        mode: str = "ecommerce",
+        durations: Optional[Dict[str, float]] = None,
+        **kwargs: Any,
+    ) -> List[str]:
         """执行切片并返回输出文件路径列表。默认输出目录为视频同名目录。
 
         当 `mode` 为场景化模式（`ecommerce`/`game`/`entertainment`）时，使用融合算法生成高光片段并采用 `libx264+aac` 重编码导出，以保证切割精确与兼容性。
         另支持场景化聚合模式 `jumpcut`。
+
+        传入 `durations` 字典时，会写入每个输出文件的时长 {输出路径: 秒}（场景化模式取导出的片段时长），
+        调用方无需再对输出逐个执行 ffprobe。
         """
         name = os.path.splitext(os.path.basename(video_path))[0]
         if not output_dir:
@@ -741,6 +784,7 @@ class BroadcastVideoSlices:
                 clusters,
                 crf=int(kwargs.get("crf", 23)),
                 use_nvenc=self._use_nvenc(bool(kwargs.get("use_nvenc", True))),
+                durations=durations,
             )
         else:
             raise ValueError("mode 需为 'ecommerce'、'game'、'entertainment' 或 'jumpcut'")
@@ -829,6 +873,8 @@ class BroadcastVideoSlices:
                 traceback.print_exc()
                 xprint({"phase": "subtitle_error", "index": idx + 1, "error": str(e)})
             outs.append(final_path)
+            if durations is not None:
+                durations[final_path] = duration
             total_export_duration += duration
         coverage = (total_export_duration / original_duration) if original_duration > 0 else 0.0
         xprint({
@@ -15,6 +15,7 @@ def main() -> None:
     p.add_argument("--profile", default="ecommerce", help="jumpcut 基于的场景化配置：ecommerce/game/entertainment")
     p.add_argument("--model-size", default="large-v3", help="Whisper 模型大小，如 large-v3/medium/small；默认自动")
     p.add_argument("--device", default="auto", help="运行设备：auto/cuda/cpu")
+    p.add_argument("--compute-type", default=None, help="Whisper 推理精度：float16/int8_float16/int8；默认 cuda 用 float16、cpu 用 int8")
     p.add_argument("--models-root", required=True, help="模型基础目录，包含子目录 faster_wishper 与 florence2")
     p.add_argument("--language", default="zh", help="ASR语言，默认 zh")
     p.add_argument("--use-nvenc", action="store_true", help="使用 NVENC 进行视频编码")
@@ -47,6 +48,7 @@ def main() -> None:
         model_size=args.model_size,
         device=args.device,
         models_root=models_root,
+        compute_type=args.compute_type,
     )
 
     for video_file in video_files: